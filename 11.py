@@ -1,15 +1,21 @@
+import argparse
 import math
 from OpenGL.GL import *
 from OpenGL.GLU import *
 from OpenGL.GLUT import *
 from OpenGL.GLUT.fonts import GLUT_BITMAP_HELVETICA_18
 import random
+import time
+import numpy
+import rasterize
 
 
 WINDOW_WIDTH = 800
 WINDOW_HEIGHT = 600
 BASKET_WIDTH = 40
 BASKET_HEIGHT = 30
+BASKET_TOP = 60
+BASKET_BOTTOM = 30
 MAX_MISSED_FRUITS = 20
 
 
@@ -17,6 +23,10 @@ BUTTON_SIZE = 40
 BUTTON_SPACING = 10
 BUTTON_Y = WINDOW_HEIGHT - 50
 
+TIMER_INTERVAL = 16        # ms between GLUT timer callbacks
+TICK = 0.016               # seconds of game time per simulation step
+MAX_CATCH_UP_STEPS = 5     # None lets a slow frame run every pending step
+
 
 game_paused = False
 game_over = False
@@ -25,18 +35,129 @@ hearts = 5
 missed_fruits = 0
 basket_position = WINDOW_WIDTH // 2
 
-fruits = []
-bombs = []
-eggs = []
+accumulator = 0.0
+last_update_time = None
+frame_time = TICK
+render_alpha = 1.0
+redisplay_pending = False
+
+APPLE, BANANA, GRAPE, BOMB, EGG = range(5)
+KIND_NAMES = ('apple', 'banana', 'grape', 'bomb', 'egg')
+FRUIT_POINTS = {APPLE: 1, BANANA: 2, GRAPE: 3}
+BOMB_DAMAGE = 2
+EGG_HEAL = 1
+
+class EntityStore:
+    # Falling objects kept as parallel arrays, slots [0, count) are in use
+    FIELDS = (
+        ('x', numpy.float64), ('y', numpy.float64), ('prev_y', numpy.float64),
+        ('radius', numpy.int32),
+        ('speed', numpy.float64), ('kind', numpy.int8), ('alive', numpy.bool_),
+    )
 
-class GameObject:    
-    def __init__(self, x, y, radius, speed, object_type):
-        self.x = x
-        self.y = y
-        self.radius = radius
-        self.speed = speed
-        self.type = object_type
-        self.missed = False
+    def __init__(self, capacity=256):
+        self.count = 0
+        self.max_radius = 0
+        self.version = 0  # bumped whenever positions or slots change
+        for name, dtype in self.FIELDS:
+            setattr(self, name, numpy.zeros(capacity, dtype=dtype))
+
+    def grow(self, capacity):
+        for name, dtype in self.FIELDS:
+            array = numpy.zeros(capacity, dtype=dtype)
+            array[:self.count] = getattr(self, name)[:self.count]
+            setattr(self, name, array)
+
+    def add(self, x, y, radius, speed, kind):
+        if self.count == len(self.x):
+            self.grow(2 * len(self.x))
+        i = self.count
+        self.x[i] = x
+        self.y[i] = y
+        self.prev_y[i] = y
+        self.radius[i] = radius
+        self.speed[i] = speed
+        self.kind[i] = kind
+        self.alive[i] = True
+        self.count += 1
+        self.max_radius = max(self.max_radius, radius)
+        self.version += 1
+
+    def compact(self):
+        # drop dead slots keeping survivors in spawn order, which
+        # update_game_state relies on when a tick has catches and misses
+        n = self.count
+        keep = self.alive[:n].copy()  # alive itself is compacted below
+        end = int(numpy.count_nonzero(keep))
+        if end == n:
+            return
+        for name, _ in self.FIELDS:
+            array = getattr(self, name)
+            array[:end] = array[:n][keep]
+        self.count = end
+
+    def clear(self):
+        self.count = 0
+        self.max_radius = 0
+        self.version += 1
+
+entities = EntityStore()
+
+class SpatialGrid:
+    # Uniform grid over object centres for area queries. It is rebuilt lazily,
+    # on the first query after the store has changed. Objects outside the
+    # window are clamped into the border cells so queries stay conservative.
+    def __init__(self, store, cell_size=32, width=WINDOW_WIDTH, height=WINDOW_HEIGHT + 64):
+        self.store = store
+        self.cell_size = cell_size
+        self.columns = width // cell_size + 1
+        self.rows = height // cell_size + 1
+        self.order = numpy.zeros(0, dtype=numpy.intp)
+        self.starts = numpy.zeros(self.rows * self.columns + 1, dtype=numpy.intp)
+        self.version = None
+
+    def cell_range(self, low, high, cells):
+        first = min(max(int(low // self.cell_size), 0), cells - 1)
+        last = min(max(int(high // self.cell_size), 0), cells - 1)
+        return first, last
+
+    def rebuild(self):
+        n = self.store.count
+        scale = 1.0 / self.cell_size
+        columns = (self.store.x[:n] * scale).astype(numpy.int32).clip(0, self.columns - 1)
+        rows = (self.store.y[:n] * scale).astype(numpy.int32).clip(0, self.rows - 1)
+        cells = rows * self.columns + columns
+        self.order = numpy.argsort(cells, kind='stable')
+        counts = numpy.bincount(cells, minlength=self.rows * self.columns)
+        self.starts[1:] = numpy.cumsum(counts)
+        self.version = self.store.version
+
+    def query_aabb(self, left, bottom, right, top):
+        # indices of objects whose circle may overlap the box (broad phase only)
+        if self.version != self.store.version:
+            self.rebuild()
+        reach = self.store.max_radius
+        first_col, last_col = self.cell_range(left - reach, right + reach, self.columns)
+        first_row, last_row = self.cell_range(bottom - reach, top + reach, self.rows)
+        chunks = []
+        for row in range(first_row, last_row + 1):
+            start = self.starts[row * self.columns + first_col]
+            end = self.starts[row * self.columns + last_col + 1]
+            if end > start:
+                chunks.append(self.order[start:end])
+        if not chunks:
+            return self.order[:0]
+        return numpy.concatenate(chunks)
+
+    def query_circle(self, cx, cy, r):
+        # indices of objects whose circle overlaps the circle at (cx, cy)
+        nearby = self.query_aabb(cx - r, cy - r, cx + r, cy + r)
+        dx = self.store.x[nearby] - cx
+        dy = self.store.y[nearby] - cy
+        reach = self.store.radius[nearby] + r
+        return nearby[dx*dx + dy*dy <= reach*reach]
+
+grid = SpatialGrid(entities)
 
 # Button
 buttons = {
@@ -48,87 +169,110 @@ buttons = {
     
 }
 
-def midpoint_line(x1, y1, x2, y2):    
-    dx = abs(x2 - x1)
-    dy = abs(y2 - y1)
-    sx = 1 if x2 > x1 else -1
-    sy = 1 if y2 > y1 else -1
-    err = dx - dy
-
-    glBegin(GL_POINTS)
-    while True:
-        glVertex2f(x1, y1)
-        if x1 == x2 and y1 == y2:
-            break
-        e2 = 2 * err
-        if e2 > -dy:
-            err -= dy
-            x1 += sx
-        if e2 < dx:
-            err += dx
-            y1 += sy
-    glEnd()
-
-def fill_circle(x, y, radius):    
-    glBegin(GL_POINTS)
-    for dy in range(-radius, radius + 1):
-        for dx in range(-radius, radius + 1):
-            if dx*dx + dy*dy <= radius*radius:
-                glVertex2f(x + dx, y + dy)
-    glEnd()
-
-def draw_apple(x, y, radius):    
-    glBegin(GL_POINTS)
-    glColor3f(0.8, 0.1, 0.1)
+class PointBatch:
+    # Collects every GL_POINTS vertex of a frame so it can be drawn with one call
+    def __init__(self, capacity=65536):
+        self.vertices = numpy.empty((capacity, 2), dtype=numpy.float32)
+        self.colors = numpy.empty((capacity, 3), dtype=numpy.float32)
+        self.count = 0
+
+    def reserve(self, extra):
+        needed = self.count + extra
+        capacity = len(self.vertices)
+        if needed <= capacity:
+            return
+        while capacity < needed:
+            capacity *= 2
+        vertices = numpy.empty((capacity, 2), dtype=numpy.float32)
+        colors = numpy.empty((capacity, 3), dtype=numpy.float32)
+        vertices[:self.count] = self.vertices[:self.count]
+        colors[:self.count] = self.colors[:self.count]
+        self.vertices = vertices
+        self.colors = colors
+
+    def add(self, points, color):
+        points = numpy.asarray(points, dtype=numpy.float32).reshape(-1, 2)
+        n = len(points)
+        if not n:
+            return
+        self.reserve(n)
+        self.vertices[self.count:self.count + n] = points
+        self.colors[self.count:self.count + n] = color
+        self.count += n
+
+    def add_sprites(self, sprite, positions):
+        offsets, colors = sprite
+        n = len(offsets) * len(positions)
+        self.reserve(n)
+        end = self.count + n
+        out = self.vertices[self.count:end].reshape(len(positions), len(offsets), 2)
+        numpy.add(positions[:, None, :], offsets[None, :, :], out=out)
+        self.colors[self.count:end].reshape(len(positions), len(offsets), 3)[:] = colors
+        self.count = end
+
+    def flush(self):
+        if not self.count:
+            return
+        glEnableClientState(GL_VERTEX_ARRAY)
+        glEnableClientState(GL_COLOR_ARRAY)
+        glVertexPointer(2, GL_FLOAT, 0, self.vertices)
+        glColorPointer(3, GL_FLOAT, 0, self.colors)
+        glDrawArrays(GL_POINTS, 0, self.count)
+        glDisableClientState(GL_COLOR_ARRAY)
+        glDisableClientState(GL_VERTEX_ARRAY)
+        self.count = 0
+
+batch = PointBatch()
+
+def circle_sprite(radius):
+    return [((1.0, 1.0, 1.0), rasterize.filled_circle_offsets(radius))]
+
+def apple_sprite(radius):    
+    body = []
     for dy in range(-radius, radius + 1):
         height_scale = 1.1  
         width = int(math.sqrt(radius*radius - (dy/height_scale)**2))
         for dx in range(-width, width + 1):
-            glVertex2f(x + dx, y + dy)
+            body.append((dx, dy))
 
-    glColor3f(0.4, 0.2, 0.0)#stem
+    stem = []
     for i in range(10):
-        stem_x = x + math.sin(i/3.0) * 2
-        stem_y = y + radius + i
+        stem_x = math.sin(i/3.0) * 2
+        stem_y = radius + i
         for dx in range(-1, 2):
-            glVertex2f(stem_x + dx, stem_y)
+            stem.append((stem_x + dx, stem_y))
 
-    glColor3f(0.2, 0.8, 0.2)#leaf
+    leaf = []
     for i in range(8):
-        leaf_x = x + 3 + i
-        leaf_y = y + radius + math.sin(i/2.0) * 3
+        leaf_x = 3 + i
+        leaf_y = radius + math.sin(i/2.0) * 3
         for dy in range(-2, 3):
-            glVertex2f(leaf_x, leaf_y + dy)    
-    glEnd()
+            leaf.append((leaf_x, leaf_y + dy))
+    return [((0.8, 0.1, 0.1), body), ((0.4, 0.2, 0.0), stem), ((0.2, 0.8, 0.2), leaf)]
 
-def draw_banana(x, y, radius):
-    glBegin(GL_POINTS)
-    glColor3f(1.0, 0.8, 0.0) 
+def banana_sprite(radius):
+    body = []
     for t in range(60):
         angle = t * math.pi / 60  
-        curve_x = x + radius * math.cos(angle)
-        curve_y = y + radius * math.sin(angle) * 0.7  
+        curve_x = radius * math.cos(angle)
+        curve_y = radius * math.sin(angle) * 0.7  
 
         thickness = int(5 + 3 * abs(math.sin(angle)))  
         for r in range(-thickness, thickness + 1):
             px = curve_x + r * math.cos(angle + math.pi/2)
             py = curve_y + r * math.sin(angle + math.pi/2)
-            glVertex2f(px, py)
-    
+            body.append((px, py))
 
-    glColor3f(0.4, 0.2, 0.0)  # Stem
+    stem = []
     for dx in range(-3, 4):
         for dy in range(-3, 4):
             if dx*dx + dy*dy <= 9:
-                glVertex2f(x - radius + dx, y + dy)   
-                glVertex2f(x + radius + dx, y + dy)  
-    glEnd()
-
+                stem.append((-radius + dx, dy))
+                stem.append((radius + dx, dy))
+    return [((1.0, 0.8, 0.0), body), ((0.4, 0.2, 0.0), stem)]
 
-def draw_grape(x, y, radius):
-    glBegin(GL_POINTS)
-
-    glColor3f(0.6, 0.2, 0.8)  
+def grape_sprite(radius):
+    bunch = []
     offsets = [
         (0, 0), (radius, 0), (-radius, 0),  # First row
         (-radius//2, -radius), (radius//2, -radius),  # Second row
@@ -138,71 +282,135 @@ def draw_grape(x, y, radius):
         for dy in range(-radius, radius + 1):
             circle_width = int(math.sqrt(radius*radius - dy**2))
             for dx in range(-circle_width, circle_width + 1):
-                glVertex2f(x + ox + dx, y + oy + dy)
-    
-    glEnd()
-    
+                bunch.append((ox + dx, oy + dy))
 
-    glBegin(GL_POINTS)
-    glColor3f(0.4, 0.2, 0.0)  # Stem
+    stem = []
     for i in range(radius * 2):
-        stem_x = x
-        stem_y = y + radius + i
         for dx in range(-1, 2):  
-            glVertex2f(stem_x + dx, stem_y)
-    glEnd()
-
-
+            stem.append((dx, radius + i))
+    return [((0.6, 0.2, 0.8), bunch), ((0.4, 0.2, 0.0), stem)]
 
-def draw_egg(x, y, radius):
-    glBegin(GL_POINTS)
-    glColor3f(1.0, 1.0, 0.9)
+def egg_sprite(radius):
+    shell = []
     for dy in range(-radius, radius + 1):
         width_scale = 1.0 + 0.3 * (dy / radius)
         width = int(math.sqrt(radius*radius - dy*dy) * width_scale)
         for dx in range(-width, width + 1):
-            glVertex2f(x + dx, y + dy)
+            shell.append((dx, dy))
 
-    glColor3f(1.0, 1.0, 1.0)
-    highlight_radius = radius // 3
-    for dy in range(-highlight_radius, highlight_radius + 1):
-        for dx in range(-highlight_radius, highlight_radius + 1):
-            if dx*dx + dy*dy <= highlight_radius*highlight_radius:
-                glVertex2f(x - radius//3 + dx, y + radius//3 + dy)    
-    glEnd()
-
-def draw_bomb(x, y, radius):
-    glColor3f(0.1, 0.1, 0.1)
-    fill_circle(x, y, radius)
-    
-    glBegin(GL_POINTS)
-    glColor3f(0.6, 0.3, 0.0)
+    highlight = rasterize.filled_circle_points(-(radius//3), radius//3, radius // 3)
+    return [((1.0, 1.0, 0.9), shell), ((1.0, 1.0, 1.0), highlight)]
+
+def bomb_sprite(radius):
+    body = circle_sprite(radius)[0][1]
+
+    fuse = []
     for i in range(12):
-        fuse_x = x + math.sin(i/2.0) * 2
-        fuse_y = y + radius + i
+        fuse_x = math.sin(i/2.0) * 2
+        fuse_y = radius + i
         for dx in range(-1, 2):
-            glVertex2f(fuse_x + dx, fuse_y)
-    glColor3f(0.3, 0.3, 0.3)
-    highlight_radius = radius // 3
-    for dy in range(-highlight_radius, highlight_radius + 1):
-        for dx in range(-highlight_radius, highlight_radius + 1):
-            if dx*dx + dy*dy <= highlight_radius*highlight_radius:
-                glVertex2f(x - radius//3 + dx, y + radius//3 + dy)
-    glEnd()
+            fuse.append((fuse_x + dx, fuse_y))
+
+    highlight = rasterize.filled_circle_points(-(radius//3), radius//3, radius // 3)
+    return [((0.1, 0.1, 0.1), body), ((0.6, 0.3, 0.0), fuse), ((0.3, 0.3, 0.3), highlight)]
+
+def basket_sprite(width):
+    lines = []
+    for i in range(-width, width + 1, 2):
+        y = 60 - int((-i * i) / (width * 4))
+        lines.append(rasterize.line_points(i, y, i + 2, y))
+
+    lines.append(rasterize.line_points(-width, 60, -width + 15, 30))
+    lines.append(rasterize.line_points(width, 60, width - 15, 30))
+    lines.append(rasterize.line_points(-width + 15, 30, width - 15, 30))
+    return [((0.8, 0.6, 0.4), numpy.concatenate(lines))]
+
+SPRITE_BUILDERS = {
+    'basket': basket_sprite,
+    'circle': circle_sprite,
+    'apple': apple_sprite,
+    'banana': banana_sprite,
+    'grape': grape_sprite,
+    'egg': egg_sprite,
+    'bomb': bomb_sprite,
+}
+
+# (shape, radius) -> (offsets, colors), built once and translated at draw time
+sprite_cache = {}
+
+def get_sprite(shape, radius):
+    sprite = sprite_cache.get((shape, radius))
+    if sprite is None:
+        offsets = []
+        colors = []
+        for color, points in SPRITE_BUILDERS[shape](radius):
+            offsets.extend(points)
+            colors.extend([color] * len(points))
+        sprite = (
+            numpy.array(offsets, dtype=numpy.float32).reshape(-1, 2),
+            numpy.array(colors, dtype=numpy.float32).reshape(-1, 3),
+        )
+        sprite_cache[(shape, radius)] = sprite
+    return sprite
+
+def warm_sprite_cache():
+    for shape in ('apple', 'banana', 'grape'):
+        get_sprite(shape, 15)
+    get_sprite('bomb', 12)
+    get_sprite('egg', 10)
+    get_sprite('circle', BUTTON_SIZE//2)
+    get_sprite('basket', BASKET_WIDTH)
+
+def fill_circle(x, y, radius, color):    
+    offsets, _ = get_sprite('circle', radius)
+    batch.add(offsets + (x, y), color)
+
+def draw_entities(alpha):
+    n = entities.count
+    kinds = entities.kind[:n]
+    prev_y = entities.prev_y[:n]
+    ys = prev_y + (entities.y[:n] - prev_y) * alpha
+    for kind, name in enumerate(KIND_NAMES):
+        mask = kinds == kind
+        if not mask.any():
+            continue
+        radii = entities.radius[:n][mask]
+        positions = numpy.column_stack((entities.x[:n][mask], ys[mask]))
+        for radius in numpy.unique(radii):
+            batch.add_sprites(get_sprite(name, int(radius)), positions[radii == radius])
+
+# HUD key -> display list holding its baked points
+static_lists = {}
+
+def call_static(key, build):
+    global batch
+    list_id = static_lists.get(key)
+    if list_id is None:
+        frame_batch = batch
+        batch = PointBatch(4096)
+        list_id = glGenLists(1)
+        glNewList(list_id, GL_COMPILE)
+        build()
+        batch.flush()
+        glEndList()
+        batch = frame_batch
+        static_lists[key] = list_id
+    glCallList(list_id)
 
 def draw_button(x, y, button_type, hover):
+    call_static(('button', button_type, hover),
+                lambda: build_button(x, y, button_type, hover))
+
+def build_button(x, y, button_type, hover):
     button = buttons[button_type]
     color = button['color']
 
     if hover:
-        glColor3f(color[0] + 0.2, color[1] + 0.2, color[2] + 0.2)
-    else:
-        glColor3f(*color)
+        color = (color[0] + 0.2, color[1] + 0.2, color[2] + 0.2)
 
-    fill_circle(x + BUTTON_SIZE//2, y + BUTTON_SIZE//2, BUTTON_SIZE//2)
+    fill_circle(x + BUTTON_SIZE//2, y + BUTTON_SIZE//2, BUTTON_SIZE//2, color)
     
-    glBegin(GL_POINTS)
-    glColor3f(1.0, 1.0, 1.0)
+    points = []
     
 
     if button_type == 'restart':
@@ -213,29 +421,41 @@ def draw_button(x, y, button_type, hover):
             py = y + BUTTON_SIZE//2 + r * math.sin(angle)
             for dx in range(-1, 2):
                 for dy in range(-1, 2):
-                    glVertex2f(px + dx, py + dy)
+                    points.append((px + dx, py + dy))
     elif button_type == 'pause':
         for i in range(BUTTON_SIZE//2):
-            glVertex2f(x + BUTTON_SIZE//3, y + BUTTON_SIZE//3 + i)
-            glVertex2f(x + 2*BUTTON_SIZE//3, y + BUTTON_SIZE//3 + i)
+            points.append((x + BUTTON_SIZE//3, y + BUTTON_SIZE//3 + i))
+            points.append((x + 2*BUTTON_SIZE//3, y + BUTTON_SIZE//3 + i))
     elif button_type == 'exit':
         for i in range(-BUTTON_SIZE//4, BUTTON_SIZE//4):
-            glVertex2f(x + BUTTON_SIZE//2 + i, y + BUTTON_SIZE//2 + i)
-            glVertex2f(x + BUTTON_SIZE//2 + i, y + BUTTON_SIZE//2 - i)
+            points.append((x + BUTTON_SIZE//2 + i, y + BUTTON_SIZE//2 + i))
+            points.append((x + BUTTON_SIZE//2 + i, y + BUTTON_SIZE//2 - i))
     
-    glEnd()
+    batch.add(points, (1.0, 1.0, 1.0))
 
 def check_button_hover(mouse_x, mouse_y):
+    changed = False
     for button_name, button in buttons.items():
         center_x = button['x'] + BUTTON_SIZE//2
         center_y = BUTTON_Y + BUTTON_SIZE//2
         distance = math.sqrt((mouse_x - center_x)**2 + (mouse_y - center_y)**2)
-        button['hover'] = distance <= BUTTON_SIZE//2
+        hover = distance <= BUTTON_SIZE//2
+        if hover != button['hover']:
+            button['hover'] = hover
+            changed = True
+    return changed
+
+def request_redisplay():
+    # at most one glutPostRedisplay between two display() calls
+    global redisplay_pending
+    if not redisplay_pending:
+        redisplay_pending = True
+        glutPostRedisplay()
 
 def mouse_motion(x, y):
     y = WINDOW_HEIGHT - y  
-    check_button_hover(x, y)
-    glutPostRedisplay()
+    if check_button_hover(x, y):
+        request_redisplay()
 
 def mouse_click(button, state, x, y):
     global game_paused, game_over
@@ -256,96 +476,86 @@ def mouse_click(button, state, x, y):
                     glutLeaveMainLoop()
 
 def create_fruit():
-    fruit_types = [
-        ('apple', 1, (1.0, 0.0, 0.0)),
-        ('banana', 2, (1.0, 0.8, 0.0)),
-        ('grape',3, (0.6, 0.2, 0.8))
-    ]
+    fruit_types = [APPLE, BANANA, GRAPE]
     fruit_type = random.choice(fruit_types)
-    return GameObject(
+    entities.add(
         random.randint(30, WINDOW_WIDTH - 30),
         WINDOW_HEIGHT + 20,15,
         random.uniform(1, 2),
-        {'name': fruit_type[0], 'points': fruit_type[1], 'color': fruit_type[2]}
+        fruit_type
     )
 
 def create_bomb():
-    return GameObject(
+    entities.add(
         random.randint(30, WINDOW_WIDTH - 30),
         WINDOW_HEIGHT + 20,
         12,
         random.uniform(2.5, 3.5),
-        {'name': 'bomb', 'damage': 2, 'color': (0.2, 0.2, 0.2)}
+        BOMB
     )
 
 def create_egg():
-    return GameObject(
+    entities.add(
         random.randint(30, WINDOW_WIDTH - 30),
         WINDOW_HEIGHT + 20,10, random.uniform(2.0, 3.0),
-        {'name': 'egg', 'heal': 1, 'color': (1.0, 1.0, 0.9)}
+        EGG
     )
 
 def draw_basket():
-    glColor3f(0.8, 0.6, 0.4)
-    for i in range(-BASKET_WIDTH, BASKET_WIDTH + 1, 2):
-        x = basket_position + i
-        y = 60 - int((-i * i) / (BASKET_WIDTH * 4))
-        midpoint_line(x, y, x + 2, y)
-
-    midpoint_line(basket_position - BASKET_WIDTH, 60,
-                 basket_position - BASKET_WIDTH + 15, 30)
-    midpoint_line(basket_position + BASKET_WIDTH, 60,
-                 basket_position + BASKET_WIDTH - 15, 30)
-    midpoint_line(basket_position - BASKET_WIDTH + 15, 30,
-                 basket_position + BASKET_WIDTH - 15, 30)
+    basket = numpy.array([(basket_position, 0)], dtype=numpy.float64)
+    batch.add_sprites(get_sprite('basket', BASKET_WIDTH), basket)
 
 def update_game_state():
     global score, hearts, missed_fruits, game_over    
     if game_paused or game_over:
         return
     
-    for fruit in fruits[:]:
-        fruit.y -= fruit.speed
-        if fruit.y < 0:
-            fruits.remove(fruit)
+    n = entities.count
+    if not n:
+        return
+    y = entities.y[:n]
+    entities.prev_y[:n] = y
+    y -= entities.speed[:n]
+    kinds = entities.kind[:n]
+    missed = y < 0
+
+    # broad phase: only objects whose bottom edge can reach the basket band
+    nearby = numpy.flatnonzero((y >= BASKET_BOTTOM) & (y <= BASKET_TOP + entities.max_radius))
+    caught = numpy.zeros(n, dtype=bool)
+    caught[nearby] = check_collision(entities.x[nearby], y[nearby], entities.radius[nearby])
+
+    for i in numpy.flatnonzero((missed | caught) & (kinds <= GRAPE)):
+        if missed[i]:
             missed_fruits += 1
             if missed_fruits % 3 == 0:  
                 hearts -= 1
                 if hearts <= 0:
                     game_over = True
-        elif check_collision(fruit):
-            score += fruit.type['points']
-            fruits.remove(fruit)
+        else:
+            score += FRUIT_POINTS[kinds[i]]
             missed_fruits = 0 
              
-    for bomb in bombs[:]:
-        bomb.y -= bomb.speed
-        if bomb.y < 0:
-            bombs.remove(bomb)
-        elif check_collision(bomb):
-            hearts -= 2  # Decrease hearts by 2 for bomb collision
-            bombs.remove(bomb)
-            if hearts <= 0:
-                game_over = True
-
-    for egg in eggs[:]:
-        egg.y -= egg.speed
-        if egg.y < 0:
-            eggs.remove(egg)
-        elif check_collision(egg):
-            hearts = min(hearts + 1, 5)  
-            eggs.remove(egg)
-
-
-def check_collision(obj):
+    bombs_caught = int(numpy.count_nonzero(caught & (kinds == BOMB)))
+    if bombs_caught:
+        hearts -= BOMB_DAMAGE * bombs_caught  # Decrease hearts by 2 per bomb collision
+        if hearts <= 0:
+            game_over = True
+
+    eggs_caught = int(numpy.count_nonzero(caught & (kinds == EGG)))
+    if eggs_caught:
+        hearts = min(hearts + EGG_HEAL * eggs_caught, 5)  
+
+    entities.alive[:n] = ~(missed | caught)
+    entities.compact()
+    entities.version += 1
+
+
+def check_collision(x, y, radius):
     basket_left = basket_position - BASKET_WIDTH
     basket_right = basket_position + BASKET_WIDTH
-    basket_top = 60
-    basket_bottom = 30
-    if obj.y - obj.radius <= basket_top and obj.y - obj.radius >= basket_bottom:
-        if basket_left <= obj.x <= basket_right:
-            return True
-    return False
+    bottom = y - radius
+    return ((bottom <= BASKET_TOP) & (bottom >= BASKET_BOTTOM)
+            & (basket_left <= x) & (x <= basket_right))
 
 def spawn_objects():
     if game_paused or game_over:
@@ -356,27 +566,43 @@ def spawn_objects():
     egg_chance = 0.005                             # Remains constant
     
     if random.random() < fruit_chance:
-        fruits.append(create_fruit())
+        create_fruit()
     if random.random() < bomb_chance:
-        bombs.append(create_bomb())
+        create_bomb()
     if random.random() < egg_chance:
-        eggs.append(create_egg())
+        create_egg()
 
 def draw_hearts():
+    call_static(('hearts', hearts), build_hearts)
+
+def build_hearts():
     for i in range(hearts):
         heart_x = WINDOW_WIDTH // 2 - (hearts * 15) + i * 30
         heart_y = WINDOW_HEIGHT - 30        
-        glColor3f(1.0, 0.2, 0.2)
-        glBegin(GL_POINTS)
+        points = []
         for t in range(360):
             angle = math.radians(t)
             x = 16 * math.sin(angle) ** 3
             y = 13 * math.cos(angle) - 5 * math.cos(2*angle) - 2 * math.cos(3*angle)
             scale = 0.7
-            glVertex2f(heart_x + x * scale, heart_y + y * scale)
-        glEnd()
+            points.append((heart_x + x * scale, heart_y + y * scale))
+        batch.add(points, (1.0, 0.2, 0.2))
+
+# (x, y) -> [text, display list]; a slot is recompiled only when its text changes
+text_lists = {}
 
 def draw_text(x, y, text):
+    slot = text_lists.get((x, y))
+    if slot is None:
+        slot = text_lists[(x, y)] = [None, glGenLists(1)]
+    if slot[0] != text:
+        glNewList(slot[1], GL_COMPILE)
+        build_text(x, y, text)
+        glEndList()
+        slot[0] = text
+    glCallList(slot[1])
+
+def build_text(x, y, text):
     glColor3f(0.0, 0.0, 0.0)
     glRasterPos2f(x + 1, y - 1)
     for ch in text:
@@ -387,24 +613,14 @@ def draw_text(x, y, text):
         glutBitmapCharacter(GLUT_BITMAP_HELVETICA_18, ord(ch))
 
 def display():
-    global fruits
+    global redisplay_pending
+    redisplay_pending = False
     glClear(GL_COLOR_BUFFER_BIT)    
     if not game_over:
         draw_basket()        
-        for fruit in fruits:
-            if fruit.type['name'] == 'apple':
-                draw_apple(fruit.x, fruit.y, fruit.radius)
-            elif fruit.type['name'] == 'banana':
-                draw_banana(fruit.x, fruit.y, fruit.radius)
-            elif fruit.type['name'] == 'grape':
-                draw_grape(fruit.x, fruit.y, fruit.radius)
-        
-        for bomb in bombs:
-            draw_bomb(bomb.x, bomb.y, bomb.radius)
-        
-        for egg in eggs:
-            draw_egg(egg.x, egg.y, egg.radius)
+        draw_entities(render_alpha)
         
+        batch.flush()
         draw_hearts()
         draw_text(10, WINDOW_HEIGHT - 30,f"Score: {score}  Missed: {missed_fruits}/{MAX_MISSED_FRUITS}")
 
@@ -426,11 +642,34 @@ def display():
     
     glutSwapBuffers()
 
-def update(value):
+def simulate_step():
     spawn_objects()
     update_game_state()
-    glutPostRedisplay()
-    glutTimerFunc(16, update, 0) 
+
+def update(value):
+    global accumulator, last_update_time, frame_time, render_alpha
+    now = time.perf_counter()
+    if last_update_time is not None:
+        frame_time = now - last_update_time
+    last_update_time = now
+
+    if game_paused or game_over:
+        accumulator = 0.0
+        render_alpha = 1.0
+    else:
+        accumulator += frame_time
+        steps = 0
+        while accumulator >= TICK:
+            if MAX_CATCH_UP_STEPS is not None and steps >= MAX_CATCH_UP_STEPS:
+                accumulator %= TICK  # too far behind, drop the backlog
+                break
+            simulate_step()
+            accumulator -= TICK
+            steps += 1
+        render_alpha = accumulator / TICK
+
+    request_redisplay()
+    glutTimerFunc(TIMER_INTERVAL, update, 0) 
 
 def keyboard(key, x, y):
     global basket_position, game_paused    
@@ -447,7 +686,7 @@ def keyboard(key, x, y):
 
 def reset_game():
     global game_paused, game_over, score, hearts, missed_fruits
-    global fruits, bombs, eggs, basket_position
+    global basket_position
     
     game_paused = False
     game_over = False
@@ -455,34 +694,124 @@ def reset_game():
     hearts = 5
     missed_fruits = 0
     basket_position = WINDOW_WIDTH // 2
-    fruits.clear()
-    bombs.clear()
-    eggs.clear()
-
-
-glutInit()
-glutInitDisplayMode(GLUT_DOUBLE | GLUT_RGB)
-glutInitWindowSize(WINDOW_WIDTH, WINDOW_HEIGHT)
-glutInitWindowPosition(100, 100)
-glutCreateWindow(b"Fruit Frenzy")
-glClearColor(0.0, 0.0, 0.1, 1.0)  ##Dark Blue BG
-glMatrixMode(GL_PROJECTION)
-glLoadIdentity()
-gluOrtho2D(0, WINDOW_WIDTH, 0, WINDOW_HEIGHT)
-glutDisplayFunc(display)
-glutKeyboardFunc(keyboard)
-glutTimerFunc(16, update, 0)
-glutPassiveMotionFunc(mouse_motion)
-glutMouseFunc(mouse_click)
-
-print("\nFruit Frenzy Controls:")
-print("a/d - Move basket left/right")
-print("p - Pause/Unpause game")
-print("q - Quit game")
-print("\nMouse Controls:")
-print("- Click the circular buttons to:")
-print("  * Restart game (Green)")
-print("  * Pause/Play (Blue)")
-print("  * Exit game (Red)")
-
-glutMainLoop()
+    entities.clear()
+
+
+class NullBatch(PointBatch):
+    # Headless backend: geometry is generated as usual but never sent to GL
+    def __init__(self, capacity=65536):
+        PointBatch.__init__(self, capacity)
+        self.points_drawn = 0
+
+    def flush(self):
+        self.points_drawn += self.count
+        self.count = 0
+
+def fill_stress(count, spread):
+    creators = (create_fruit, create_bomb, create_egg)
+    while entities.count < count:
+        random.choice(creators)()
+        if spread:
+            i = entities.count - 1
+            entities.y[i] = entities.prev_y[i] = random.uniform(0, WINDOW_HEIGHT + 20)
+    entities.version += 1
+
+def steer_basket():
+    global basket_position
+    n = entities.count
+    fruit = numpy.flatnonzero(entities.kind[:n] <= GRAPE)
+    if not len(fruit):
+        return
+    target = entities.x[fruit[numpy.argmin(entities.y[fruit])]]
+    step = max(-10, min(10, target - basket_position))
+    basket_position = int(min(max(basket_position + step, BASKET_WIDTH),
+                              WINDOW_WIDTH - BASKET_WIDTH))
+
+def run_headless(ticks, seed, stress=0):
+    global batch
+    random.seed(seed)
+    warm_sprite_cache()
+    reset_game()
+    batch = NullBatch()
+    if stress:
+        fill_stress(stress, True)
+
+    clock = time.perf_counter
+    phases = {'spawn': 0.0, 'update': 0.0, 'render': 0.0}
+    games = 1
+    peak = entities.count
+    start = clock()
+    for tick in range(ticks):
+        if game_over:
+            games += 1
+            reset_game()
+            if stress:
+                fill_stress(stress, True)
+        t0 = clock()
+        spawn_objects()
+        if stress:
+            fill_stress(stress, False)
+        t1 = clock()
+        steer_basket()
+        update_game_state()
+        t2 = clock()
+        draw_basket()
+        draw_entities(1.0)
+        batch.flush()
+        t3 = clock()
+        phases['spawn'] += t1 - t0
+        phases['update'] += t2 - t1
+        phases['render'] += t3 - t2
+        peak = max(peak, entities.count)
+    elapsed = clock() - start
+
+    print(f"ticks: {ticks}  seed: {seed}  stress: {stress}")
+    print(f"elapsed: {elapsed:.3f}s  ticks/sec: {ticks / elapsed:.1f}")
+    print(f"objects alive: {entities.count}  peak: {peak}  games: {games}  score: {score}")
+    print(f"points generated: {batch.points_drawn}")
+    for name, total in phases.items():
+        print(f"  {name:<7} {total * 1000:10.2f} ms  {total / ticks * 1e6:9.2f} us/tick")
+
+def main():
+    warm_sprite_cache()
+    glutInit()
+    glutInitDisplayMode(GLUT_DOUBLE | GLUT_RGB)
+    glutInitWindowSize(WINDOW_WIDTH, WINDOW_HEIGHT)
+    glutInitWindowPosition(100, 100)
+    glutCreateWindow(b"Fruit Frenzy")
+    glClearColor(0.0, 0.0, 0.1, 1.0)  ##Dark Blue BG
+    glMatrixMode(GL_PROJECTION)
+    glLoadIdentity()
+    gluOrtho2D(0, WINDOW_WIDTH, 0, WINDOW_HEIGHT)
+    glutDisplayFunc(display)
+    glutKeyboardFunc(keyboard)
+    glutTimerFunc(TIMER_INTERVAL, update, 0)
+    glutPassiveMotionFunc(mouse_motion)
+    glutMouseFunc(mouse_click)
+
+    print("\nFruit Frenzy Controls:")
+    print("a/d - Move basket left/right")
+    print("p - Pause/Unpause game")
+    print("q - Quit game")
+    print("\nMouse Controls:")
+    print("- Click the circular buttons to:")
+    print("  * Restart game (Green)")
+    print("  * Pause/Play (Blue)")
+    print("  * Exit game (Red)")
+
+    glutMainLoop()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Fruit Frenzy")
+    parser.add_argument('--headless', type=int, metavar='TICKS',
+                        help="run TICKS simulation steps without a window and print timings")
+    parser.add_argument('--seed', type=int, default=0,
+                        help="random seed for headless runs")
+    parser.add_argument('--stress', type=int, default=0, metavar='COUNT',
+                        help="keep at least COUNT objects falling during headless runs")
+    args = parser.parse_args()
+    if args.headless:
+        run_headless(args.headless, args.seed, args.stress)
+    else:
+        main()
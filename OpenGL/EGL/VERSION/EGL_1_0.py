@@ -20,4 +20,10 @@ def glInitEgl10VERSION():
     return extensions.hasGLExtension( _EXTENSION_NAME )
 
 
-### END AUTOGENERATED SECTION
\ No newline at end of file
+### END AUTOGENERATED SECTION
+from OpenGL import contextdata
+eglCreateContext = contextdata.createsContext( eglCreateContext )
+eglMakeCurrent = contextdata.makesCurrent( eglMakeCurrent )
+eglDestroyContext = contextdata.destroysContext( eglDestroyContext, 1, deferCurrent=True )
+from OpenGL import error as _error
+eglSwapBuffers = _error.checkpointAfter( eglSwapBuffers )
@@ -20,4 +20,6 @@ def glInitEgl12VERSION():
     return extensions.hasGLExtension( _EXTENSION_NAME )
 
 
-### END AUTOGENERATED SECTION
\ No newline at end of file
+### END AUTOGENERATED SECTION
+from OpenGL import contextdata
+eglReleaseThread = contextdata.makesCurrent( eglReleaseThread )
@@ -3,6 +3,9 @@ from OpenGL.GL.ARB import vertex_buffer_object
 from OpenGL.GL.ARB import uniform_buffer_object
 from OpenGL.GL.ARB import texture_buffer_object
 from OpenGL.GL.ARB import enhanced_layouts
+from OpenGL.GL.ARB import map_buffer_range
+from OpenGL.GL.ARB import buffer_storage
+from OpenGL.GL.ARB import sync
 
 class Implementation( vbo.Implementation ):
     """OpenGL ARB extension-based implementation of VBO interfaces"""
@@ -33,6 +36,13 @@ class Implementation( vbo.Implementation ):
                     found =True 
                     break
             assert found, name
+        for name in self.OPTIONAL_NAMES:
+            value = None
+            for source_extension in (map_buffer_range, buffer_storage, sync):
+                value = getattr( source_extension, name, None )
+                if value is not None:
+                    break
+            setattr( self, name, value )
         if self.glGenBuffers:
             self.available = True
 Implementation.register()
@@ -0,0 +1,175 @@
+"""Lazy loading of the OpenGL.GL namespace (OpenGL.LAZY_LOADING)
+
+With LAZY_LOADING set, importing OpenGL.GL does not import the VERSION
+modules (and through them the raw modules and their thousands of
+constants and function pointers).  Instead a module __getattr__ looks
+the name up in a precomputed name -> module index (OpenGL.GL._lazyindex)
+and imports only the module which defines it on first access.  If the
+raw index (OpenGL.raw._index) has been built, constants are created
+straight from it without importing any module (names which are aliases
+of another constant in the eager namespace resolve to that constant).
+
+The index is generated from the eager namespace, so that each name
+resolves to exactly the object that `from OpenGL.GL import *` would
+produce.  Regenerate it after changing the GL modules with:
+
+    python -m OpenGL.GL._lazy
+"""
+import importlib, os
+
+# The modules star-imported by OpenGL.GL, in order (later ones win)
+SOURCES = [
+    'OpenGL.GL.VERSION.GL_1_1',
+    'OpenGL.GL.pointers',
+    'OpenGL.GL.images',
+    'OpenGL.GL.exceptional',
+    'OpenGL.GL.glget',
+] + [
+    'OpenGL.GL.VERSION.GL_%s'%(version,) for version in (
+        '1_2', '1_3', '1_4', '1_5', '2_0', '2_1',
+        '3_0', '3_1', '3_2', '3_3',
+        '4_0', '4_1', '4_2', '4_3', '4_4', '4_5', '4_6',
+    )
+] + [
+    'OpenGL.error',
+]
+# Names bound directly in OpenGL.GL (alias -> original)
+ALIASES = {
+    'GLerror': 'GLError',
+    'glRotate': 'glRotated',
+    'glTranslate': 'glTranslated',
+    'glLight': 'glLightfv',
+    'glTexCoord': 'glTexCoord2d',
+    'glScale': 'glScaled',
+    'glNormal': 'glNormal3d',
+    'glGetBoolean': 'glGetBooleanv',
+    'glGetDouble': 'glGetDoublev',
+    'glGetFloat': 'glGetFloatv',
+    'glGetInteger': 'glGetIntegerv',
+    'glGetPolygonStippleub': 'glGetPolygonStipple',
+}
+
+def exported_names( module ):
+    """Names `from module import *` would bind"""
+    names = getattr( module, '__all__', None )
+    if names is None:
+        names = [ name for name in vars( module ) if not name.startswith( '_' ) ]
+    return names
+
+def build_index():
+    """Produce module -> [names] by importing the SOURCES eagerly"""
+    owners = {}
+    for source in SOURCES:
+        module = importlib.import_module( source )
+        for name in exported_names( module ):
+            owners[name] = source
+    index = {}
+    for name, source in sorted( owners.items() ):
+        index.setdefault( source, [] ).append( name )
+    return index
+
+def build_aliases( index ):
+    """Produce name -> target for the constants bound under another name
+
+    e.g. GL_LINE_WIDTH_RANGE is GL_SMOOTH_LINE_WIDTH_RANGE in the eager
+    namespace, while the raw index has the (differently named) raw
+    constant.  target is None where the aliased constant is not itself
+    in the namespace, such names are always imported.
+    """
+    from OpenGL.constant import Constant
+    owners = dict( (name, source) for source, names in index.items() for name in names )
+    aliases = {}
+    for name, source in owners.items():
+        if not name.startswith( 'GL_' ):
+            continue
+        value = getattr( importlib.import_module( source ), name )
+        if not isinstance( value, Constant ) or value.name == name:
+            continue
+        target = value.name
+        if target not in owners or getattr(
+            importlib.import_module( owners[target] ), target
+        ) is not value:
+            target = None
+        aliases[name] = target
+    return aliases
+
+def write_index( filename=None ):
+    """Write the index for build_index() to OpenGL/GL/_lazyindex.py"""
+    if filename is None:
+        filename = os.path.join( os.path.dirname( __file__ ), '_lazyindex.py' )
+    index = build_index()
+    aliases = build_aliases( index )
+    lines = [
+        '"""Generated by OpenGL.GL._lazy, do not edit"""',
+        'MODULES = {',
+    ]
+    for source in SOURCES:
+        if source in index:
+            lines.append( '    %r: """'%( source, ) )
+            names = index[source]
+            for i in range( 0, len(names), 4 ):
+                lines.append( '        '+' '.join( names[i:i+4] ) )
+            lines.append( '    """,' )
+    lines.append( '}' )
+    lines.append( 'CONSTANT_ALIASES = {' )
+    for name in sorted( aliases ):
+        lines.append( '    %r: %r,'%( name, aliases[name] ) )
+    lines.append( '}' )
+    with open( filename, 'w' ) as fh:
+        fh.write( '\n'.join( lines )+'\n' )
+    return filename
+
+def load_index():
+    """Load (name -> module, constant aliases) from the generated OpenGL.GL._lazyindex"""
+    from OpenGL.GL._lazyindex import MODULES, CONSTANT_ALIASES
+    index = {}
+    for source, names in MODULES.items():
+        for name in names.split():
+            index[name] = source
+    return index, CONSTANT_ALIASES
+
+def _lazy_vbo_implementation():
+    """Registered in place of the GL/ARB vboimplementation modules"""
+    from OpenGL.GL import vboimplementation
+    from OpenGL.GL.ARB import vboimplementation as arb_implementation
+    return vboimplementation.Implementation()
+
+def install( namespace ):
+    """Install lazy __getattr__, __dir__ and __all__ into the OpenGL.GL namespace"""
+    index, constantAliases = load_index()
+    from OpenGL.raw import _index
+    rawIndex = _index.load()
+    def __getattr__( name ):
+        """Import the module defining name and return (and cache) the value"""
+        source = index.get( name )
+        if source is None:
+            original = ALIASES.get( name )
+            if original is None:
+                raise AttributeError(
+                    """module %r has no attribute %r"""%( namespace['__name__'], name )
+                )
+            value = __getattr__( original )
+        else:
+            value = None
+            if rawIndex is not None and name.startswith( 'GL_' ):
+                if name in constantAliases:
+                    # the raw constant of that name is not the one bound here
+                    target = constantAliases[name]
+                    if target is not None:
+                        value = __getattr__( target )
+                else:
+                    value = rawIndex.constant( 'GL', name )
+            if value is None:
+                value = getattr( importlib.import_module( source ), name )
+        namespace[name] = value
+        return value
+    def __dir__():
+        return sorted( set( namespace ) | set( index ) | set( ALIASES ) )
+    namespace['__getattr__'] = __getattr__
+    namespace['__dir__'] = __dir__
+    namespace['__all__'] = sorted( set( index ) | set( ALIASES ) )
+    from OpenGL.arrays import vbo
+    vbo.Implementation.IMPLEMENTATION_CLASSES.append( _lazy_vbo_implementation )
+
+if __name__ == "__main__":
+    print( write_index() )
@@ -1,5 +1,5 @@
 from OpenGL.arrays import vbo
-from OpenGL.GL.VERSION import GL_1_5, GL_3_0, GL_3_1
+from OpenGL.GL.VERSION import GL_1_5, GL_3_0, GL_3_1, GL_3_2, GL_4_4
 
 class Implementation( vbo.Implementation ):
     """OpenGL-based implementation of VBO interfaces"""
@@ -15,6 +15,13 @@ class Implementation( vbo.Implementation ):
                     found = True 
                     break 
             assert found, name
+        for name in self.OPTIONAL_NAMES:
+            value = None
+            for source in (GL_3_0, GL_3_2, GL_4_4):
+                value = getattr( source, name, None )
+                if value is not None:
+                    break
+            setattr( self, name, value )
         if GL_1_5.glBufferData:
             self.available = True
 
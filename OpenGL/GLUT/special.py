@@ -64,7 +64,7 @@ if __glutInitWithExit:
     def _base_glutInit(pargc, argv):
         """Overrides base glut init with exit-function-aware version"""
         return __glutInitWithExit(pargc, argv, _exitfunc)
-    def glutCreateWindow(title):
+    def _base_glutCreateWindow(title):
         """Create window with given title
         
         This is the Win32-specific version that handles
@@ -79,6 +79,7 @@ if __glutInitWithExit:
         """
         return __glutCreateMenuWithExit(callback, _exitfunc)
 else:
+    _base_glutCreateWindow = _simple.glutCreateWindow
     _base_glutInit = platform.nullFunction( 
         'glutInit', GLUT,
         resultType=None, 
@@ -93,6 +94,14 @@ else:
 ##_base_glutReshapeFunc = GLUT.glutReshapeFunc
 _base_glutDestroyWindow = getattr(GLUT, 'glutDestroyWindow', None)
 
+# creating or setting the window changes the current context
+glutCreateWindow = contextdata.makesCurrent( _base_glutCreateWindow )
+glutCreateWindow.wrappedOperation = _simple.glutCreateWindow
+glutCreateSubWindow = contextdata.makesCurrent( _simple.glutCreateSubWindow )
+glutSetWindow = contextdata.makesCurrent( _simple.glutSetWindow )
+# a frame boundary for deferred (ERROR_CHECK_INTERVAL) error checking
+glutSwapBuffers = error.checkpointAfter( _simple.glutSwapBuffers )
+
 class GLUTCallback( object ):
     """Class implementing GLUT Callback registration functions"""
     def __init__( self, typeName, parameterTypes, parameterNames ):
@@ -343,10 +352,14 @@ def glutDestroyWindow( window ):
     context = 0
     try:
         GLUT.glutSetWindow(window)
+        contextdata.invalidateCurrent()
         context = contextdata.getContext()
         result = contextdata.cleanupContext( context )
         _log.info( """Cleaning up context data for window %s: %s""", window, result )
     except Exception as err:
         _log.error( """Error attempting to clean up context data for GLUT window %s: %s""", window, result )
-    return _base_glutDestroyWindow( window )
+    try:
+        return _base_glutDestroyWindow( window )
+    finally:
+        contextdata.invalidateCurrent()
 glutDestroyWindow.wrappedOperation = _simple.glutDestroyWindow
@@ -20,4 +20,10 @@ def glInitGlx10VERSION():
     return extensions.hasGLExtension( _EXTENSION_NAME )
 
 
-### END AUTOGENERATED SECTION
\ No newline at end of file
+### END AUTOGENERATED SECTION
+from OpenGL import contextdata
+glXCreateContext = contextdata.createsContext( glXCreateContext )
+glXMakeCurrent = contextdata.makesCurrent( glXMakeCurrent )
+glXDestroyContext = contextdata.destroysContext( glXDestroyContext, 1, deferCurrent=True )
+from OpenGL import error as _error
+glXSwapBuffers = _error.checkpointAfter( glXSwapBuffers )
@@ -20,4 +20,7 @@ def glInitGlx13VERSION():
     return extensions.hasGLExtension( _EXTENSION_NAME )
 
 
-### END AUTOGENERATED SECTION
\ No newline at end of file
+### END AUTOGENERATED SECTION
+from OpenGL import contextdata
+glXCreateNewContext = contextdata.createsContext( glXCreateNewContext )
+glXMakeContextCurrent = contextdata.makesCurrent( glXMakeContextCurrent )
@@ -1,3 +1,9 @@
 from OpenGL.raw.WGL.VERSION.WGL_1_0 import *
+from OpenGL import contextdata as _contextdata, error as _error
 
 wglUseFontBitmaps = wglUseFontBitmapsW
+wglCreateContext = _contextdata.createsContext( wglCreateContext )
+wglMakeCurrent = _contextdata.makesCurrent( wglMakeCurrent )
+wglDeleteContext = _contextdata.destroysContext( wglDeleteContext, 0 )
+SwapBuffers = _error.checkpointAfter( SwapBuffers )
+wglSwapLayerBuffers = _error.checkpointAfter( wglSwapLayerBuffers )
@@ -78,6 +78,16 @@ import occurs the flags should no longer be changed.
 
         Default: False
 
+    CACHE_CURRENT_CONTEXT -- if set to True, OpenGL.contextdata
+        caches the current context per-thread rather than querying
+        the platform on every stored-pointer access.  The cache is
+        reset by PyOpenGL's make-current entry points (eglMakeCurrent,
+        glXMakeCurrent, wglMakeCurrent, glutSetWindow...), code making
+        contexts current by other means (e.g. GUI toolkits) must call
+        OpenGL.contextdata.invalidateCurrent() when doing so.
+
+        Default: False (PYOPENGL_CACHE_CURRENT_CONTEXT environment variable)
+
     STORE_POINTERS -- if set to True, PyOpenGL array operations
         will attempt to store references to pointers which are
         being passed in order to prevent memory-access failures
@@ -164,7 +174,40 @@ import occurs the flags should no longer be changed.
         operations.
 
         Default: True
+
+    USE_PYTHON_CALCULATORS -- if True and OpenGL_accelerate is not
+        in use, finalised wrappers use the pure-Python calculator
+        classes in OpenGL._pywrapper (same structure as the
+        OpenGL_accelerate ones, inspectable and patchable per
+        wrapper) instead of generated straight-line call functions.
+
+        Default: False
     
+    LAZY_LOADING -- if True, importing OpenGL.GL does not import
+        the GL VERSION modules, names are looked up in a precomputed
+        index and their defining module imported on first access
+        (see OpenGL.GL._lazy).  Reduces startup time for processes
+        which only use a handful of entry points.
+
+        Default: False (PYOPENGL_LAZY_LOADING environment variable)
+
+    ERROR_CHECK_INTERVAL -- if set to N > 0 (and ERROR_CHECKING is
+        True) glGetError is only called every N GL calls, and after
+        glEnd, glFlush, glFinish, buffer swaps and calls to
+        OpenGL.error.checkpoint(), rather than after every call.
+        The GLError raised lists the most recent calls since the
+        previous check (see ERROR_HISTORY) in its `calls` attribute.
+        Avoids the pipeline stall a glGetError causes on some drivers
+        while still detecting errors.  OpenGL_accelerate's error
+        checker is not used in this mode.
+
+        Default: 0 (PYOPENGL_ERROR_CHECK_INTERVAL environment variable)
+
+    ERROR_HISTORY -- number of calls recorded for reporting by
+        ERROR_CHECK_INTERVAL error checking.
+
+        Default: 16 (PYOPENGL_ERROR_HISTORY environment variable)
+
     MODULE_ANNOTATIONS -- if True, attempt to annotate alternates() and 
         constants to track in which module they are defined (only useful 
         for the documentation-generation passes, really).
@@ -177,6 +220,30 @@ import occurs the flags should no longer be changed.
         annotations dictionary are generally either ctypes types or 
         ArrayDataType references, so this isn't *likely* to be all that useful
         without further work.
+
+    WRAPPER_CODE_CACHE -- directory in which the code objects generated
+        for Wrapper calls (when OpenGL_accelerate is not in use) are
+        cached between runs.  If None, generated code is only shared
+        within the current process.
+
+        Default: None (PYOPENGL_WRAPPER_CODE_CACHE environment variable)
+
+    IMPORT_PROFILE -- if set, record the time, memory and number of
+        constants, functions and wrappers created by the import of each
+        OpenGL module, and write a report sorted by time to this file
+        at exit ("-" for stderr, see OpenGL._importprofile).
+
+        Default: None (PYOPENGL_IMPORT_PROFILE environment variable)
+
+    COPY_DIAGNOSTICS -- if set (and ERROR_ON_COPY is not), the array
+        handlers record every implicit copy or conversion of array
+        data with the GL entry point, source type, byte count and
+        Python call site, and write a report aggregated by call site
+        to this file at exit ("-" for stderr, see
+        OpenGL.arrays.copydiagnostics).  Finds the copies ERROR_ON_COPY
+        would raise on without breaking code which relies on them.
+
+        Default: None (PYOPENGL_COPY_DIAGNOSTICS environment variable)
 """
 from OpenGL.version import __version__
 import os
@@ -202,13 +269,26 @@ WARN_ON_FORMAT_UNAVAILABLE = False
 FORWARD_COMPATIBLE_ONLY = False
 SIZE_1_ARRAY_UNPACK = True
 USE_ACCELERATE = environ_key("USE_ACCELERATE", True)
+USE_PYTHON_CALCULATORS = environ_key("USE_PYTHON_CALCULATORS", False)
+LAZY_LOADING = environ_key("LAZY_LOADING", False)
 CONTEXT_CHECKING = environ_key("CONTEXT_CHECKING", False)
+CACHE_CURRENT_CONTEXT = environ_key("CACHE_CURRENT_CONTEXT", False)
 
 FULL_LOGGING = environ_key("FULL_LOGGING", False)
 ALLOW_NUMPY_SCALARS = environ_key("ALLOW_NUMPY_SCALARS", False)
 UNSIGNED_BYTE_IMAGES_AS_STRING = environ_key("UNSIGNED_BYTE_IMAGES_AS_STRING", True)
 MODULE_ANNOTATIONS = False
 TYPE_ANNOTATIONS = False
+WRAPPER_CODE_CACHE = os.environ.get("PYOPENGL_WRAPPER_CODE_CACHE") or None
+ERROR_CHECK_INTERVAL = int(os.environ.get("PYOPENGL_ERROR_CHECK_INTERVAL") or 0)
+ERROR_HISTORY = int(os.environ.get("PYOPENGL_ERROR_HISTORY") or 16)
+IMPORT_PROFILE = os.environ.get("PYOPENGL_IMPORT_PROFILE") or None
+COPY_DIAGNOSTICS = os.environ.get("PYOPENGL_COPY_DIAGNOSTICS") or None
+
+if IMPORT_PROFILE:
+    from OpenGL import _importprofile
+
+    _importprofile.install(IMPORT_PROFILE)
 
 
 # Declarations of plugins provided by PyOpenGL itself
@@ -223,6 +303,7 @@ PlatformPlugin("posix", "OpenGL.platform.glx.GLXPlatform")
 PlatformPlugin("x11", "OpenGL.platform.glx.GLXPlatform")  # xdg session type
 PlatformPlugin("osmesa", "OpenGL.platform.osmesa.OSMesaPlatform")
 PlatformPlugin("egl", "OpenGL.platform.egl.EGLPlatform")
+PlatformPlugin("null", "OpenGL.platform.null.NullPlatform")
 PlatformPlugin("wayland", "OpenGL.platform.egl.EGLPlatform")  # xdg session type
 PlatformPlugin(
     "xwayland", "OpenGL.platform.egl.EGLPlatform"
@@ -356,8 +437,11 @@ FormatHandler(
     "OpenGL.arrays.buffers.BufferHandler",
     [
         "OpenGL.arrays._buffers.Py_buffer",
+        "OpenGL.arrays._buffers.BufferView",
         _bi + ".memoryview",
         _bi + ".bytearray",
+        "array.array",
+        "mmap.mmap",
     ],
     isOutput=True,
 )
@@ -370,6 +454,10 @@ FormatHandler(
 FormatHandler(
     "vbooffset",
     "OpenGL.arrays.vbo.VBOOffsetHandler",
-    ["OpenGL.arrays.vbo.VBOOffset", "OpenGL_accelerate.vbo.VBOOffset"],
+    [
+        "OpenGL.arrays.vbo.VBOOffset",
+        "OpenGL_accelerate.vbo.VBOOffset",
+        "OpenGL.arrays.vbo.StreamingVBO",
+    ],
     isOutput=False,
 )
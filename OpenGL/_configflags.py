@@ -9,11 +9,19 @@ from OpenGL import (
     FORWARD_COMPATIBLE_ONLY,
     SIZE_1_ARRAY_UNPACK,
     USE_ACCELERATE,
+    USE_PYTHON_CALCULATORS,
+    LAZY_LOADING,
     CONTEXT_CHECKING,
+    CACHE_CURRENT_CONTEXT,
 
     FULL_LOGGING,
     ALLOW_NUMPY_SCALARS,
     UNSIGNED_BYTE_IMAGES_AS_STRING,
     MODULE_ANNOTATIONS,
     TYPE_ANNOTATIONS,
+    WRAPPER_CODE_CACHE,
+    IMPORT_PROFILE,
+    COPY_DIAGNOSTICS,
+    ERROR_CHECK_INTERVAL,
+    ERROR_HISTORY,
 )
@@ -0,0 +1,261 @@
+"""Import-time profiling of the OpenGL package tree (OpenGL.IMPORT_PROFILE)
+
+With the PYOPENGL_IMPORT_PROFILE environment variable set, OpenGL
+installs an import hook before importing anything else, and records for
+every OpenGL (and OpenGL_accelerate) module that gets imported:
+
+    time -- wall-clock seconds spent executing the module
+    memory -- bytes allocated (net, as traced by tracemalloc)
+    constants -- OpenGL.constant.Constant instances created
+    functions -- base function pointers created (null/lazy function
+        pointers and platform.constructFunction results)
+    wrappers -- OpenGL.wrapper.Wrapper instances created
+
+each both for the module's own body ("self") and including the modules
+it imported ("total"), along with the module which first imported it.
+At exit a report sorted by self time is written to the file named by
+the variable, or to stderr if the value is "-", "1" or "true":
+
+    PYOPENGL_IMPORT_PROFILE=imports.txt python myapp.py
+
+Tracing allocations slows down imports noticeably, so times are only
+meaningful relative to each other.  Modules imported before OpenGL
+itself (ctypes, numpy...) are not recorded, and OpenGL/__init__.py is
+only accounted for as the importer of the modules below it.
+"""
+import atexit, logging, sys, time, tracemalloc
+_log = logging.getLogger( 'OpenGL.importprofile' )
+
+PACKAGES = ('OpenGL', 'OpenGL_accelerate')
+COUNTERS = ('constants', 'functions', 'wrappers')
+SORT_KEYS = (
+    'self_time', 'total_time', 'self_memory', 'total_memory',
+) + COUNTERS
+
+class ModuleRecord( object ):
+    """Costs of importing a single module"""
+    __slots__ = (
+        'name', 'parent', 'order',
+        'self_time', 'total_time', 'self_memory', 'total_memory',
+    ) + COUNTERS
+    def __init__( self, name, parent, order ):
+        self.name = name
+        self.parent = parent
+        self.order = order
+        for key in SORT_KEYS:
+            setattr( self, key, 0 )
+    def asDict( self ):
+        """Produce a plain dictionary of the record (e.g. for json)"""
+        return dict( (key, getattr( self, key )) for key in self.__slots__ )
+
+class _Frame( object ):
+    """A module whose execution is in progress"""
+    __slots__ = ('record', 'start', 'memory', 'counts', 'child_time', 'child_memory', 'child_counts')
+    def __init__( self, record, start, memory, counts ):
+        self.record = record
+        self.start = start
+        self.memory = memory
+        self.counts = counts
+        self.child_time = 0.0
+        self.child_memory = 0
+        self.child_counts = [0] * len( COUNTERS )
+
+class ImportProfiler( object ):
+    """Collects ModuleRecords as modules are executed"""
+    def __init__( self ):
+        self.records = {}
+        self.stack = []
+        self.counts = dict( (key, 0) for key in COUNTERS )
+
+    def count( self, key ):
+        self.counts[key] += 1
+
+    def _counts( self ):
+        return [ self.counts[key] for key in COUNTERS ]
+
+    def enter( self, name ):
+        """Module name is about to be executed"""
+        parent = self.stack[-1].record.name if self.stack else None
+        record = ModuleRecord( name, parent, len( self.records ) )
+        self.records[name] = record
+        self.stack.append( _Frame(
+            record,
+            time.perf_counter(),
+            tracemalloc.get_traced_memory()[0],
+            self._counts(),
+        ) )
+
+    def exit( self ):
+        """The module on top of the stack has finished executing"""
+        frame = self.stack.pop()
+        record = frame.record
+        record.total_time = time.perf_counter() - frame.start
+        record.total_memory = tracemalloc.get_traced_memory()[0] - frame.memory
+        record.self_time = record.total_time - frame.child_time
+        record.self_memory = record.total_memory - frame.child_memory
+        totals = [ now - start for now, start in zip( self._counts(), frame.counts ) ]
+        for key, total, child in zip( COUNTERS, totals, frame.child_counts ):
+            setattr( record, key, total - child )
+        if self.stack:
+            parent = self.stack[-1]
+            parent.child_time += record.total_time
+            parent.child_memory += record.total_memory
+            parent.child_counts = [
+                child + total for child, total in zip( parent.child_counts, totals )
+            ]
+
+    def sorted( self, key='self_time' ):
+        """Records sorted (descending) by key"""
+        if key not in SORT_KEYS:
+            raise ValueError( """Unknown sort key %r, expected one of %s"""%( key, ', '.join( SORT_KEYS ) ) )
+        return sorted( self.records.values(), key=lambda record: (-getattr( record, key ), record.order) )
+
+    def report( self, key='self_time' ):
+        """Produce a text report of the records sorted by key"""
+        records = self.sorted( key )
+        roots = [ record for record in records if record.parent not in self.records ]
+        lines = [
+            'PyOpenGL import profile: %s modules, %.1f ms, %.1f KiB, %s constants, %s functions, %s wrappers'%(
+                len( records ),
+                sum( record.total_time for record in roots ) * 1000,
+                sum( record.total_memory for record in roots ) / 1024.0,
+                sum( record.constants for record in records ),
+                sum( record.functions for record in records ),
+                sum( record.wrappers for record in records ),
+            ),
+            '%9s %9s %10s %10s %6s %6s %6s  %s'%(
+                'self ms', 'total ms', 'self KiB', 'total KiB',
+                'consts', 'funcs', 'wraps', 'module (imported by)',
+            ),
+        ]
+        for record in records:
+            lines.append( '%9.2f %9.2f %10.1f %10.1f %6d %6d %6d  %s (%s)'%(
+                record.self_time * 1000,
+                record.total_time * 1000,
+                record.self_memory / 1024.0,
+                record.total_memory / 1024.0,
+                record.constants,
+                record.functions,
+                record.wrappers,
+                record.name,
+                record.parent or '-',
+            ) )
+        return '\n'.join( lines ) + '\n'
+
+    def write( self, target ):
+        """Write report() to the filename target (or stderr for '-', '1', 'true')"""
+        text = self.report()
+        if target.lower() in ('-', '1', 'true'):
+            sys.stderr.write( text )
+        else:
+            try:
+                with open( target, 'w' ) as fh:
+                    fh.write( text )
+            except (IOError, OSError) as err:
+                _log.warning( 'Unable to write import profile to %r: %s', target, err )
+
+class _ProfilingLoader( object ):
+    """Delegates to the real loader, timing exec_module"""
+    def __init__( self, loader, profiler ):
+        self.loader = loader
+        self.profiler = profiler
+    def create_module( self, spec ):
+        create = getattr( self.loader, 'create_module', None )
+        return create( spec ) if create is not None else None
+    def exec_module( self, module ):
+        # introspection (get_data, resources) should see the real loader
+        module.__loader__ = self.loader
+        self.profiler.enter( module.__name__ )
+        try:
+            self.loader.exec_module( module )
+        finally:
+            self.profiler.exit()
+            _patch( module.__name__ )
+    def __getattr__( self, key ):
+        return getattr( self.loader, key )
+
+class _ProfilingFinder( object ):
+    """Meta-path finder wrapping the loaders of PACKAGES modules"""
+    def __init__( self, profiler ):
+        self.profiler = profiler
+    def find_spec( self, fullname, path, target=None ):
+        if fullname.split( '.' )[0] not in PACKAGES:
+            return None
+        for finder in sys.meta_path:
+            if finder is self or not hasattr( finder, 'find_spec' ):
+                continue
+            spec = finder.find_spec( fullname, path, target )
+            if spec is not None:
+                break
+        else:
+            return None
+        if spec.loader is not None and hasattr( spec.loader, 'exec_module' ):
+            spec.loader = _ProfilingLoader( spec.loader, self.profiler )
+        return spec
+
+def _patch_constants( module ):
+    original = module.Constant.__new__
+    def __new__( cls, *args, **named ):
+        # Constant( name, value ) re-dispatches to IntConstant( name, value )...
+        if cls is not module.Constant:
+            PROFILER.count( 'constants' )
+        return original( cls, *args, **named )
+    module.Constant.__new__ = staticmethod( __new__ )
+
+def _patch_null_functions( module ):
+    original = module._NullFunctionPointer.__init__
+    def __init__( self, *args, **named ):
+        PROFILER.count( 'functions' )
+        return original( self, *args, **named )
+    module._NullFunctionPointer.__init__ = __init__
+
+def _patch_platform( module ):
+    platform = module.PLATFORM
+    original = platform.constructFunction
+    def constructFunction( *args, **named ):
+        PROFILER.count( 'functions' )
+        return original( *args, **named )
+    # createBaseFunction looks this up on the instance
+    platform.constructFunction = constructFunction
+
+def _patch_wrappers( module ):
+    original = module.Wrapper.__init__
+    def __init__( self, *args, **named ):
+        PROFILER.count( 'wrappers' )
+        return original( self, *args, **named )
+    module.Wrapper.__init__ = __init__
+
+PATCHES = {
+    'OpenGL.constant': _patch_constants,
+    'OpenGL.platform.baseplatform': _patch_null_functions,
+    'OpenGL.platform': _patch_platform,
+    'OpenGL.wrapper': _patch_wrappers,
+}
+PROFILER = None
+
+def _patch( name ):
+    """Install the counting hooks for module name if it provides any"""
+    patch = PATCHES.pop( name, None )
+    module = sys.modules.get( name )
+    if patch is not None and module is not None:
+        patch( module )
+
+def install( target=None ):
+    """Start profiling OpenGL imports, writing the report to target at exit
+
+    Returns the ImportProfiler, whose records can also be inspected
+    directly.  Called by OpenGL/__init__.py when IMPORT_PROFILE is set.
+    """
+    global PROFILER
+    if PROFILER is not None:
+        return PROFILER
+    PROFILER = ImportProfiler()
+    if not tracemalloc.is_tracing():
+        tracemalloc.start()
+    for name in list( PATCHES ):
+        if name in sys.modules:
+            _patch( name )
+    sys.meta_path.insert( 0, _ProfilingFinder( PROFILER ) )
+    if target:
+        atexit.register( PROFILER.write, target )
+    return PROFILER
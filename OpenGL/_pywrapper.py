@@ -0,0 +1,241 @@
+"""Pure-Python equivalents of the OpenGL_accelerate.wrapper calculators
+
+These classes provide the same interface as the Cython-coded
+PyArgCalculator, CArgCalculator, CArgumentCalculator and Wrapper in
+OpenGL_accelerate, for use where the compiled extension cannot be
+installed.  Everything that can be decided when the wrapper is finalised
+is: the converters are split into index tuples of plain copies and of
+real calls, the bound __call__ of each converter is looked up once, and
+constant cConverters are pre-filled into a template, so that a call only
+loops over the converters which actually do something.
+
+Enabled by OpenGL.USE_PYTHON_CALCULATORS (see OpenGL.wrapper.finaliseCall).
+"""
+import ctypes
+from OpenGL import error
+from OpenGL._null import NULL
+from OpenGL.converters import DefaultCConverter, getPyArgsName
+
+GLError = error.GLError
+ArgumentError = ctypes.ArgumentError
+
+
+def _bound_call(converter):
+    """Retrieve the bound __call__ for converter (or converter itself)"""
+    call = getattr(converter, "__call__", None)
+    return converter if call is None else call
+
+
+class PyArgCalculator(object):
+    """Calculates pyArgs from the incoming Python args for a Wrapper"""
+
+    __slots__ = ("wrapper", "pyConverters", "required", "length", "calls")
+
+    def __init__(self, wrapper, pyConverters):
+        self.wrapper = wrapper
+        self.pyConverters = tuple(pyConverters)
+        self.length = len(self.pyConverters)
+        self.required = len(
+            [p for p in self.pyConverters if not getattr(p, "optional", False)]
+        )
+        self.calls = tuple(
+            [
+                (i, _bound_call(converter), converter)
+                for i, converter in enumerate(self.pyConverters)
+                if converter is not None
+            ]
+        )
+
+    def __call__(self, args):
+        """Convert args to a tuple of pyArgs"""
+        if self.required > len(args):
+            raise ValueError(
+                """%s requires %r arguments (%s), received %s: %r"""
+                % (
+                    self.wrapper.wrappedOperation.__name__,
+                    self.required,
+                    ", ".join(self.wrapper.pyConverterNames),
+                    len(args),
+                    args,
+                )
+            )
+        if not self.calls:
+            if len(args) == self.length:
+                return args
+            return tuple(args[: self.length])
+        if len(args) < self.length:
+            return self.short_call(args)
+        result = list(args[: self.length])
+        wrapper = self.wrapper
+        for index, call, converter in self.calls:
+            try:
+                result[index] = call(args[index], wrapper, args)
+            except IndexError:
+                result[index] = NULL
+            except Exception as err:
+                if hasattr(err, "args"):
+                    err.args += (converter,)
+                raise
+        return tuple(result)
+
+    def short_call(self, args):
+        """Slow path where optional trailing arguments were not passed"""
+        result = []
+        wrapper = self.wrapper
+        for index, converter in enumerate(self.pyConverters):
+            if converter is None:
+                result.append(args[index])
+                continue
+            try:
+                result.append(converter(args[index], wrapper, args))
+            except IndexError:
+                result.append(NULL)
+            except Exception as err:
+                if hasattr(err, "args"):
+                    err.args += (converter,)
+                raise
+        return tuple(result)
+
+
+class CArgCalculator(object):
+    """Calculates cArgs from the pyArgs for a Wrapper"""
+
+    __slots__ = ("wrapper", "cConverters", "template", "copies", "calls")
+
+    def __init__(self, wrapper, cConverters):
+        self.wrapper = wrapper
+        self.cConverters = tuple(cConverters)
+        pyLength = len(getattr(wrapper, "pyConverters", None) or ())
+        template = []
+        copies = []
+        calls = []
+        for i, converter in enumerate(self.cConverters):
+            index = getattr(converter, "index", None)
+            if (
+                type(converter) in (DefaultCConverter, getPyArgsName)
+                and isinstance(index, int)
+                and 0 <= index < pyLength
+            ):
+                copies.append((i, index))
+                template.append(None)
+            elif hasattr(converter, "__call__"):
+                calls.append((i, _bound_call(converter), converter))
+                template.append(None)
+            else:
+                template.append(converter)
+        self.template = tuple(template)
+        self.copies = tuple(copies)
+        self.calls = tuple(calls)
+
+    def __call__(self, pyArgs):
+        """Convert pyArgs to a tuple of cArgs"""
+        result = list(self.template)
+        for target, source in self.copies:
+            result[target] = pyArgs[source]
+        wrapper = self.wrapper
+        for index, call, converter in self.calls:
+            try:
+                result[index] = call(pyArgs, index, wrapper)
+            except Exception as err:
+                if hasattr(err, "args"):
+                    err.args += (
+                        """Failure in cConverter %r""" % (converter),
+                        pyArgs,
+                        index,
+                        wrapper,
+                    )
+                raise
+        return tuple(result)
+
+
+class CArgumentCalculator(object):
+    """Calculates the final ctypes arguments from cArgs for a Wrapper"""
+
+    __slots__ = ("cResolvers", "calls")
+
+    def __init__(self, cResolvers):
+        self.cResolvers = tuple(cResolvers)
+        self.calls = tuple(
+            [
+                (i, _bound_call(converter), converter)
+                for i, converter in enumerate(self.cResolvers)
+                if converter is not None
+            ]
+        )
+
+    def __call__(self, cArgs):
+        """Resolve cArgs to a tuple of ctypes-compatible arguments"""
+        result = list(cArgs)
+        for index, call, converter in self.calls:
+            try:
+                result[index] = call(cArgs[index])
+            except Exception as err:
+                err.args += (converter,)
+                raise
+        return tuple(result)
+
+
+class Wrapper(object):
+    """Calls wrappedOperation with the results of the calculators
+
+    baseOperation -- the OpenGL.wrapper.Wrapper passed to storeValues
+        and returnValues (OpenGL_accelerate passes the compiled wrapper
+        itself, which is what we do when this is not given)
+    """
+
+    __slots__ = (
+        "wrappedOperation",
+        "calculate_pyArgs",
+        "calculate_cArgs",
+        "calculate_cArguments",
+        "storeValues",
+        "returnValues",
+        "baseOperation",
+    )
+
+    def __init__(
+        self,
+        wrappedOperation,
+        calculate_pyArgs=None,
+        calculate_cArgs=None,
+        calculate_cArguments=None,
+        storeValues=None,
+        returnValues=None,
+        baseOperation=None,
+    ):
+        self.wrappedOperation = wrappedOperation
+        self.calculate_pyArgs = calculate_pyArgs
+        self.calculate_cArgs = calculate_cArgs
+        self.calculate_cArguments = calculate_cArguments
+        self.storeValues = storeValues
+        self.returnValues = returnValues
+        self.baseOperation = self if baseOperation is None else baseOperation
+
+    def __call__(self, *args):
+        """Calculate arguments, call the operation, store and return values"""
+        if self.calculate_pyArgs is not None:
+            pyArgs = self.calculate_pyArgs(args)
+        else:
+            pyArgs = args
+        if self.calculate_cArgs is not None:
+            cArgs = self.calculate_cArgs(pyArgs)
+        else:
+            cArgs = pyArgs
+        if self.calculate_cArguments is not None:
+            cArguments = self.calculate_cArguments(cArgs)
+        else:
+            cArguments = cArgs
+        try:
+            result = self.wrappedOperation(*cArguments)
+        except ArgumentError as err:
+            err.args = err.args + (cArguments,)
+            raise
+        except GLError as err:
+            err.cArgs = cArgs
+            err.pyArgs = pyArgs
+            raise
+        if self.storeValues is not None:
+            self.storeValues(result, self.baseOperation, pyArgs, cArgs)
+        if self.returnValues is not None:
+            return self.returnValues(result, self.baseOperation, pyArgs, cArgs)
+        return result
@@ -0,0 +1,288 @@
+"""Code generation for finalised Wrapper calls
+
+Wrapper.finaliseCall uses this module (when OpenGL_accelerate is not
+available) to produce a straight-line __call__ for each wrapper.  Only
+the converters which are actually present are emitted, unrolled per
+argument index, so a call pays for building its argument tuples and
+nothing else.
+
+The generated source depends only on the *shape* of the wrapper (which
+converter slots are set, which are simple argument copies, whether
+store/return values are present), not on the converter objects
+themselves, which are passed in when the call is built.  Compiled code
+objects are therefore shared between all wrappers of the same shape,
+and if OpenGL.WRAPPER_CODE_CACHE names a directory, they are persisted
+there (as a marshal file per Python implementation, PyOpenGL version
+and GENERATOR_VERSION) between runs.
+"""
+import atexit, ctypes, logging, marshal, os, sys
+from OpenGL import error
+from OpenGL._configflags import WRAPPER_CODE_CACHE
+from OpenGL._null import NULL
+from OpenGL.converters import DefaultCConverter, getPyArgsName
+from OpenGL.version import __version__
+
+_log = logging.getLogger("OpenGL.wrappercode")
+
+# increment whenever generate() (or the make_call() protocol) changes,
+# so code cached on disk by an older generator is not reused
+GENERATOR_VERSION = 1
+
+# signature -> compiled module code defining make_call()
+_CODE = {}
+# signature -> make_call() function from the executed code
+_FACTORIES = {}
+_NEW_CODE = {}
+_DISK_LOADED = False
+
+
+def signature(pyConverters, cConverters, cResolvers, storeValues, returnValues):
+    """Calculate the hashable shape description for the given wrapper
+
+    pyConverters -- 'arg' for a plain copy, 'call' for a converter
+    cConverters -- ('py', index) for a copy of a pyArg, 'call' for a
+        callable converter, 'const' for a constant value
+    cResolvers -- 'arg' for a plain copy, 'call' for a resolver
+    """
+    if pyConverters:
+        py = tuple("arg" if conv is None else "call" for conv in pyConverters)
+        required = len([p for p in pyConverters if not getattr(p, "optional", False)])
+    else:
+        py = required = None
+    if cConverters:
+        c = []
+        for conv in cConverters:
+            index = getattr(conv, "index", None) if _is_copy(conv) else None
+            if pyConverters and isinstance(index, int) and 0 <= index < len(pyConverters):
+                c.append(("py", index))
+            elif hasattr(conv, "__call__"):
+                c.append("call")
+            else:
+                c.append("const")
+        c = tuple(c)
+    else:
+        c = None
+    if cResolvers:
+        r = tuple("arg" if conv is None else "call" for conv in cResolvers)
+    else:
+        r = None
+    return (py, required, c, r, bool(storeValues), bool(returnValues))
+
+
+def _is_copy(conv):
+    """Is conv a converter which just copies a pyArg by index?"""
+    return type(conv) in (DefaultCConverter, getPyArgsName)
+
+
+def generate(sig):
+    """Generate the Python source for make_call() for the given signature"""
+    py, required, c, r, store, ret = sig
+    lines = [
+        "def make_call(wrappedOperation, self, pc, cc, cr, storeValues, returnValues):",
+    ]
+    add = lines.append
+    for prefix, kinds, wanted in (("pc", py, "call"), ("cc", c, None), ("cr", r, "call")):
+        for i, kind in enumerate(kinds or ()):
+            if wanted is None and kind not in ("call", "const"):
+                continue
+            if wanted is not None and kind != wanted:
+                continue
+            add("    %s%d = %s[%d]" % (prefix, i, prefix, i))
+    add("    def wrapperCall(*args):")
+    body = []
+    emit = body.append
+
+    # Python-level arguments
+    if py is not None:
+        emit("if %d > len(args):" % (required,))
+        emit("    raise ValueError(")
+        emit('        """%s requires %r arguments (%s), received %s: %r"""%(')
+        emit("            wrappedOperation.__name__, %d," % (required,))
+        emit('            ", ".join(self.pyConverterNames), len(args), args,')
+        emit("        )")
+        emit("    )")
+        for i, kind in enumerate(py):
+            if kind == "arg":
+                emit("p%d = args[%d]" % (i, i))
+            else:
+                emit("try:")
+                emit("    p%d = pc%d(args[%d], self, args)" % (i, i, i))
+                emit("except IndexError:")
+                emit("    p%d = NULL" % (i,))
+                emit("except Exception as err:")
+                emit("    if hasattr(err, 'args'):")
+                emit("        err.args += (pc%d,)" % (i,))
+                emit("    raise")
+        pyNames = ["p%d" % i for i in range(len(py))]
+        emit("pyArgs = (%s)" % (_tuple(pyNames),))
+    else:
+        emit("pyArgs = args")
+        pyNames = None
+
+    # C-level arguments
+    if c is not None:
+        cNames = []
+        for i, kind in enumerate(c):
+            if isinstance(kind, tuple):
+                cNames.append(pyNames[kind[1]])
+            elif kind == "const":
+                cNames.append("cc%d" % (i,))
+            else:
+                emit("try:")
+                emit("    c%d = cc%d(pyArgs, %d, self)" % (i, i, i))
+                emit("except Exception as err:")
+                emit("    if hasattr(err, 'args'):")
+                emit("        err.args += (")
+                emit('            """Failure in cConverter %%r"""%%(cc%d),' % (i,))
+                emit("            pyArgs, %d, self," % (i,))
+                emit("        )")
+                emit("    raise")
+                cNames.append("c%d" % (i,))
+        emit("cArgs = (%s)" % (_tuple(cNames),))
+        argNames = cNames
+    else:
+        emit("cArgs = pyArgs")
+        argNames = pyNames
+
+    # ctypes-level arguments
+    if r is not None:
+        callNames = []
+        for i, kind in enumerate(r):
+            source = argNames[i] if argNames is not None else "cArgs[%d]" % (i,)
+            if kind == "arg":
+                callNames.append(source)
+            else:
+                emit("try:")
+                emit("    r%d = cr%d(%s)" % (i, i, source))
+                emit("except Exception as err:")
+                emit("    err.args += (cr%d,)" % (i,))
+                emit("    raise")
+                callNames.append("r%d" % (i,))
+        call = "wrappedOperation(%s)" % (", ".join(callNames),)
+        cArguments = "(%s)" % (_tuple(callNames),)
+    elif argNames is not None:
+        call = "wrappedOperation(%s)" % (", ".join(argNames),)
+        cArguments = "cArgs"
+    else:
+        call = "wrappedOperation(*cArgs)"
+        cArguments = "cArgs"
+
+    emit("try:")
+    emit("    result = %s" % (call,))
+    emit("except ArgumentError as err:")
+    emit("    err.args = err.args + (%s,)" % (cArguments,))
+    emit("    raise")
+    emit("except GLError as err:")
+    emit("    err.cArgs = cArgs")
+    emit("    err.pyArgs = pyArgs")
+    emit("    raise")
+    if store:
+        emit("storeValues(result, self, pyArgs, cArgs)")
+    if ret:
+        emit("return returnValues(result, self, pyArgs, cArgs)")
+    else:
+        emit("return result")
+
+    lines.extend("        " + line for line in body)
+    lines.append("    return wrapperCall")
+    return "\n".join(lines) + "\n"
+
+
+def _tuple(names):
+    """Source for a tuple display of names"""
+    if len(names) == 1:
+        return names[0] + ","
+    return ", ".join(names)
+
+
+def _cache_file():
+    return os.path.join(
+        WRAPPER_CODE_CACHE,
+        "wrappercode-%s-%s-%s.marshal"
+        % (__version__, GENERATOR_VERSION, sys.implementation.cache_tag),
+    )
+
+
+def _load_disk():
+    """Load the on-disk code cache (once) into _CODE"""
+    global _DISK_LOADED
+    _DISK_LOADED = True
+    try:
+        with open(_cache_file(), "rb") as fh:
+            stored = marshal.load(fh)
+    except (OSError, EOFError, ValueError, TypeError):
+        return
+    if isinstance(stored, dict):
+        _CODE.update(stored)
+
+
+def save():
+    """Write newly generated code objects to the WRAPPER_CODE_CACHE directory"""
+    if not (WRAPPER_CODE_CACHE and _NEW_CODE):
+        return
+    filename = _cache_file()
+    try:
+        os.makedirs(WRAPPER_CODE_CACHE, exist_ok=True)
+        stored = {}
+        try:
+            with open(filename, "rb") as fh:
+                stored = marshal.load(fh)
+        except (OSError, EOFError, ValueError, TypeError):
+            pass
+        if not isinstance(stored, dict):
+            stored = {}
+        stored.update(_NEW_CODE)
+        temporary = "%s.%s.tmp" % (filename, os.getpid())
+        with open(temporary, "wb") as fh:
+            marshal.dump(stored, fh)
+        os.replace(temporary, filename)
+        _NEW_CODE.clear()
+    except OSError as err:
+        _log.info("Unable to write wrapper code cache %s: %s", filename, err)
+
+
+if WRAPPER_CODE_CACHE:
+    atexit.register(save)
+
+
+def code_for(sig):
+    """Retrieve (compiling if necessary) the code object for sig"""
+    code = _CODE.get(sig)
+    if code is None:
+        if WRAPPER_CODE_CACHE and not _DISK_LOADED:
+            _load_disk()
+            code = _CODE.get(sig)
+    if code is None:
+        source = generate(sig)
+        code = compile(source, "<OpenGL.wrapper %r>" % (sig,), "exec")
+        _CODE[sig] = code
+        if WRAPPER_CODE_CACHE:
+            _NEW_CODE[sig] = code
+    return code
+
+
+_GLOBALS = {
+    "NULL": NULL,
+    "ArgumentError": ctypes.ArgumentError,
+    "GLError": error.GLError,
+    "__builtins__": __builtins__,
+}
+
+
+def build(wrapper, pyConverters, cConverters, cResolvers, storeValues, returnValues):
+    """Produce the specialised call function for wrapper"""
+    sig = signature(pyConverters, cConverters, cResolvers, storeValues, returnValues)
+    make_call = _FACTORIES.get(sig)
+    if make_call is None:
+        namespace = dict(_GLOBALS)
+        exec(code_for(sig), namespace)
+        make_call = _FACTORIES[sig] = namespace["make_call"]
+    return make_call(
+        wrapper.wrappedOperation,
+        wrapper,
+        tuple(pyConverters or ()),
+        tuple(cConverters or ()),
+        tuple(cResolvers or ()),
+        storeValues,
+        returnValues,
+    )
@@ -5,6 +5,8 @@ import ctypes,sys
 if sys.version_info[:2] < (2,6):
     raise ImportError( 'Buffer interface only usable on Python 2.6+' )
 from ._arrayconstants import *
+from OpenGL._configflags import COPY_DIAGNOSTICS
+from OpenGL.arrays import copydiagnostics
 
 PyBUF_SIMPLE = 0
 PyBUF_WRITABLE = PyBUF_WRITEABLE = 0x0001
@@ -78,11 +80,103 @@ class Py_buffer(ctypes.Structure):
         if self.obj:
             ReleaseBuffer( self )
     def __del__( self ):
-        if self.obj:
+        # ReleaseBuffer may already be gone during interpreter shutdown
+        if self.obj and ReleaseBuffer is not None:
             ReleaseBuffer( self )
     
 BUFFER_POINTER = ctypes.POINTER( Py_buffer )
 
+# struct-module byte-order/alignment prefixes, irrelevant for GL types
+_BYTE_ORDER = '@=<>!'
+_FORMAT_TYPES = {}
+
+def glTypeForFormat( format, itemsize=None ):
+    """Map a buffer-protocol format (str or bytes) to a GL type constant
+
+    itemsize -- if given, the size of the buffer's items, raises
+        TypeError if it differs from the GL type's size (e.g. 'l' and
+        'L' are 8 bytes on LP64 platforms, but map to 32-bit GL types)
+    """
+    try:
+        return _FORMAT_TYPES[format, itemsize]
+    except KeyError:
+        pass
+    key = format
+    if isinstance( key, bytes ) and not isinstance( key, str ):
+        key = key.decode( 'ascii' )
+    if key:
+        key = key.lstrip( _BYTE_ORDER )
+    if key not in ARRAY_TO_GL_TYPE_MAPPING:
+        raise TypeError( 'Unknown format: %r'%(format,))
+    result = ARRAY_TO_GL_TYPE_MAPPING[key]
+    if itemsize is not None and BYTE_SIZES.get( result ) != itemsize:
+        raise TypeError(
+            'Format %r has %s-byte items, no GL type of that size'%( format, itemsize )
+        )
+    _FORMAT_TYPES[format, itemsize] = result
+    return result
+
+class BufferView( object ):
+    """Pinned, zero-copy view of a buffer-protocol object
+
+    Captures the data pointer and the format/shape metadata once,
+    keeping the object's buffer exported (and so its memory fixed)
+    for as long as the view is alive.  Writable buffers (bytearray,
+    array.array, writable mmap, numpy...) are pinned with
+    ctypes.c_char.from_buffer, read-only ones fall back to a
+    Py_buffer.  Provides the Py_buffer attributes used by the
+    BufferHandler (buf, len, itemsize, format, dims, readonly).
+    """
+    __slots__ = (
+        'obj', 'view', 'pin', 'buf', 'len', 'itemsize', 'format', 'dims',
+        'readonly', '__weakref__',
+    )
+    @classmethod
+    def from_object( cls, object, allowCopy=True ):
+        """Create a view of object (a BufferView is returned unchanged)
+
+        Non-contiguous buffers are copied, unless allowCopy is False in
+        which case a ValueError is raised.
+        """
+        if isinstance( object, cls ):
+            return object
+        view = memoryview( object )
+        if not view.c_contiguous:
+            if not allowCopy:
+                raise ValueError(
+                    "Buffer of %s is not contiguous, would require a copy"%( type(object), )
+                )
+            copy = memoryview( bytearray( view.tobytes() ) )
+            if COPY_DIAGNOSTICS:
+                copydiagnostics.record( 'buffers', object, copy.nbytes )
+            try:
+                view = copy.cast( view.format.lstrip( '@' ), view.shape )
+            except (TypeError, ValueError):
+                view = copy
+        self = cls()
+        self.obj = object
+        self.view = view
+        self.len = view.nbytes
+        self.itemsize = view.itemsize
+        self.format = view.format
+        self.dims = view.shape
+        self.readonly = view.readonly
+        if not self.len:
+            self.pin = None
+            self.buf = None
+        elif view.readonly:
+            self.pin = Py_buffer.from_object( view )
+            self.buf = self.pin.buf
+        else:
+            self.pin = ctypes.c_char.from_buffer( view )
+            self.buf = ctypes.addressof( self.pin )
+        return self
+    @property
+    def ndim( self ):
+        return len( self.dims )
+    def __len__( self ):
+        return self.dims[0]
+
 
 try:
     CheckBuffer = ctypes.pythonapi.PyObject_CheckBuffer
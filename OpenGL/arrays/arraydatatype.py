@@ -24,7 +24,28 @@ if acceleratesupport.ACCELERATE_AVAILABLE:
         _log.warning("Unable to load ArrayDatatype accelerator from OpenGL_accelerate")
 if ADT is None:
     # Python-coded version
+    class _CountingCache(dict):
+        """Dispatch cache which counts the lookups it answers"""
+
+        hits = 0
+
+        def get(self, key, default=None):
+            handler = dict.get(self, key, default)
+            if handler is not None:
+                self.hits += 1
+            return handler
+
     class HandlerRegistry(dict):
+        """Maps types (and plugin names) to FormatHandler instances
+
+        Lookups by type are answered from a per-type dispatch cache
+        (`cache`), which also holds sub-classes resolved through their
+        MRO or plugin matching (only explicit and plugin registrations
+        are stored in the registry itself).  The cache is cleared
+        whenever a handler is registered.  `misses` counts lookups which had to
+        resolve a type, hits are only counted once countHits() has been
+        called, to keep the per-call cost of the cache to one dict lookup.
+        """
         GENERIC_OUTPUT_PREFERENCES = ["numpy", "ctypesarrays"]
 
         def __init__(self, plugin_match):
@@ -32,6 +53,8 @@ if ADT is None:
             self.output_handler = None
             self.preferredOutput = None
             self.all_output_handlers = []
+            self.cache = {}
+            self.misses = 0
 
         def __call__(self, value):
             """Lookup of handler for given value"""
@@ -39,6 +62,16 @@ if ADT is None:
                 typ = value.__class__
             except AttributeError:
                 typ = type(value)
+            handler = self.cache.get(typ)
+            if handler is not None:
+                return handler
+            handler = self.resolve(typ, value)
+            self.misses += 1
+            self.cache[typ] = handler
+            return handler
+
+        def resolve(self, typ, value=None):
+            """Find the handler for typ without using the dispatch cache"""
             handler = self.get(typ)
             if not handler:
                 if hasattr(typ, "__mro__"):
@@ -50,18 +83,42 @@ if ADT is None:
                                 handler = handler.load()
                                 if handler:
                                     handler = handler()
+                                    # the plugin's registration for base, not
+                                    # self[base], which would clear the cache
+                                    dict.__setitem__(self, base, handler)
                         if handler:
-                            self[typ] = handler
+                            # typ itself is only cached (see __call__), so
+                            # registering a base later reaches it
                             if hasattr(handler, "registerEquivalent"):
                                 handler.registerEquivalent(typ, base)
                             return handler
-                print(self.keys())
                 raise TypeError(
                     """No array-type handler for type %s.%s (value: %s) registered"""
                     % (typ.__module__, typ.__name__, repr(value)[:50])
                 )
             return handler
 
+        def __setitem__(self, key, handler):
+            dict.__setitem__(self, key, handler)
+            self.invalidate()
+
+        def invalidate(self):
+            """Clear the per-type dispatch cache"""
+            self.cache.clear()
+
+        def countHits(self):
+            """Start counting dispatch cache hits (slows lookups)"""
+            if not isinstance(self.cache, _CountingCache):
+                self.cache = _CountingCache(self.cache)
+
+        def statistics(self):
+            """Report dispatch cache hits (None if not counted), misses and size"""
+            return {
+                "hits": getattr(self.cache, "hits", None),
+                "misses": self.misses,
+                "cached": len(self.cache),
+            }
+
         def handler_by_plugin_name(self, name):
             plugin = plugins.FormatHandler.by_name(name)
             if plugin:
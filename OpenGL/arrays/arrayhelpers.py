@@ -150,10 +150,11 @@ class storePointerType( object ):
     def __init__( self, pointerName, constant ):
         self.pointerName = pointerName
         self.constant = constant 
+        self.slot = contextdata.slotFor( constant )
     def finalise( self, wrapper ):
         self.pointerIndex = wrapper.pyArgIndex( self.pointerName )
     def __call__( self, result, baseOperation, pyArgs, cArgs ):
-        contextdata.setValue( self.constant, pyArgs[self.pointerIndex] )
+        contextdata.setSlot( self.slot, pyArgs[self.pointerIndex] )
 
 
 def setInputArraySizeType( baseOperation, size, type, argName=0 ):
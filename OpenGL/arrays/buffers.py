@@ -9,7 +9,7 @@ from OpenGL.arrays import _buffers
 from OpenGL.raw.GL import _types
 #from OpenGL.raw.GL.VERSION import GL_1_1
 from OpenGL.arrays import formathandler
-from OpenGL import _configflags
+from OpenGL import _configflags, error
 from OpenGL import acceleratesupport
 _log = logging.getLogger( __name__ )
 try:
@@ -33,30 +33,31 @@ if sys.version_info[:2] > (2,6):
             BufferHandler = MemoryviewHandler
 if not BufferHandler:
     class BufferHandler( formathandler.FormatHandler ):
-        """Buffer-protocol data-type handler for OpenGL"""
+        """Buffer-protocol data-type handler for OpenGL
+
+        Handles any buffer-protocol object (bytearray, memoryview,
+        array.array, mmap...) without copying: asArray produces a
+        _buffers.BufferView which pins the object's memory and caches
+        its pointer, format and shape, and from_param passes that
+        pointer straight to ctypes.  Only non-contiguous buffers are
+        copied (raising CopyError if ERROR_ON_COPY is set).
+        """
         isOutput=False
         ERROR_ON_COPY = _configflags.ERROR_ON_COPY
-        if sys.version_info[0] >= 3:
-            @classmethod
-            def from_param( cls, value, typeCode=None ):
-                if not isinstance( value, _buffers.Py_buffer ):
-                    value = cls.asArray( value )
-                    #raise TypeError( """Can't convert value to py-buffer in from_param""" )
-                # TODO: only do this IFF value.internal is None
-                return _types.GLvoidp( value.buf )
-#                return value
-        else:
-            @classmethod
-            def from_param( cls, value, typeCode=None ):
-                if not isinstance( value, _buffers.Py_buffer ):
-                    value = cls.asArray( value )
-                    #raise TypeError( """Can't convert value to py-buffer in from_param""" )
-                return value.buf
-        def dataPointer( value ):
-            if not isinstance( value, _buffers.Py_buffer ):
-                value = _buffers.Py_buffer.from_object( value )
+        VIEW_TYPES = (_buffers.BufferView, _buffers.Py_buffer)
+        @classmethod
+        def from_param( cls, value, typeCode=None ):
+            if not isinstance( value, cls.VIEW_TYPES ):
+                value = cls.asArray( value )
+            result = _types.GLvoidp( value.buf )
+            # keep the buffer pinned for the duration of the call
+            result._temporary_array_ = value
+            return result
+        @classmethod
+        def dataPointer( cls, value ):
+            if not isinstance( value, cls.VIEW_TYPES ):
+                value = cls.asArray( value )
             return value.buf
-        dataPointer = staticmethod( dataPointer )
         @classmethod
         def zeros( cls, dims, typeCode=None ):
             """Currently don't allow strings as output types!"""
@@ -69,30 +70,43 @@ if not BufferHandler:
         @classmethod
         def arrayToGLType( cls, value ):
             """Given a value, guess OpenGL type of the corresponding pointer"""
-            format = value.format 
-            if format in ARRAY_TO_GL_TYPE_MAPPING:
-                return ARRAY_TO_GL_TYPE_MAPPING[format]
-            raise TypeError( 'Unknown format: %r'%(format,))
+            if not isinstance( value, cls.VIEW_TYPES ):
+                value = cls.asArray( value )
+            return _buffers.glTypeForFormat( value.format, value.itemsize )
         @classmethod
         def arraySize( cls, value, typeCode = None ):
             """Given a data-value, calculate ravelled size for the array"""
+            if not isinstance( value, cls.VIEW_TYPES ):
+                value = cls.asArray( value )
             return value.len // value.itemsize
         @classmethod
         def arrayByteCount( cls, value, typeCode = None ):
             """Given a data-value, calculate number of bytes required to represent"""
+            if not isinstance( value, cls.VIEW_TYPES ):
+                value = cls.asArray( value )
             return value.len
         @classmethod 
         def unitSize( cls, value, default=None ):
+            if not isinstance( value, cls.VIEW_TYPES ):
+                value = cls.asArray( value )
             return value.dims[-1]
         @classmethod
         def asArray( cls, value, typeCode=None ):
-            """Convert given value to an array value of given typeCode"""
-            buf = _buffers.Py_buffer.from_object( value )
-            return buf
+            """Convert given value to a pinned BufferView (no copy if contiguous)"""
+            try:
+                return _buffers.BufferView.from_object(
+                    value, allowCopy=not cls.ERROR_ON_COPY,
+                )
+            except ValueError as err:
+                if cls.ERROR_ON_COPY:
+                    raise error.CopyError( *err.args )
+                raise
         @classmethod
         def dimensions( cls, value, typeCode=None ):
             """Determine dimensions of the passed array value (if possible)"""
-            return value.dims
+            if not isinstance( value, cls.VIEW_TYPES ):
+                value = cls.asArray( value )
+            return tuple( value.dims )
 
 ARRAY_TO_GL_TYPE_MAPPING = _buffers.ARRAY_TO_GL_TYPE_MAPPING
 BYTE_SIZES = _buffers.BYTE_SIZES
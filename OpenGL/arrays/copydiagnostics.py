@@ -0,0 +1,155 @@
+"""Recording of implicit array copies/conversions (OpenGL.COPY_DIAGNOSTICS)
+
+OpenGL.ERROR_ON_COPY turns every implicit data copy into a CopyError,
+which finds the copies in your own code but also breaks any third-party
+code which relies on them.  With the PYOPENGL_COPY_DIAGNOSTICS
+environment variable set, the array handlers instead record each copy
+or conversion they make (and still make it):
+
+    numpymodule -- non-arrays, non-contiguous arrays and arrays of the
+        wrong type copied by contiguous()
+    lists -- lists/tuples converted to ctypes arrays
+    strings -- unicode converted to bytes, objects converted with
+        tostring()/raw
+    buffers -- non-contiguous buffers copied into a contiguous one
+
+Records are aggregated by (GL entry point, source type, handler, Python
+call site), counting the copies and bytes copied.  The call site is the
+first frame outside the OpenGL package, the entry point is the GL
+function being called (None if the conversion was not made by a
+wrapped entry point, e.g. a raw function's argument conversion).
+
+At exit a report sorted by bytes copied is written to the file named by
+the variable, or to stderr if the value is "-", "1" or "true":
+
+    PYOPENGL_COPY_DIAGNOSTICS=- python myapp.py
+
+The records can also be inspected while running with statistics() and
+report(), and cleared with reset() (e.g. to look at a single frame).
+Setting ERROR_ON_COPY as well takes precedence, the copies raise.
+"""
+import atexit, logging, os, sys, threading
+_log = logging.getLogger( 'OpenGL.copydiagnostics' )
+
+_PACKAGE = os.path.dirname( os.path.dirname( os.path.abspath( __file__ ) ) ) + os.sep
+# generated wrapper code (see OpenGL._wrappercode) is compiled with these names
+_GENERATED = '<OpenGL'
+
+class CopyRecord( object ):
+    """Aggregated copies from a single call site"""
+    __slots__ = ('entryPoint', 'sourceType', 'handler', 'site', 'count', 'bytes')
+    def __init__( self, entryPoint, sourceType, handler, site ):
+        self.entryPoint = entryPoint
+        self.sourceType = sourceType
+        self.handler = handler
+        self.site = site
+        self.count = 0
+        self.bytes = 0
+    def asDict( self ):
+        """Produce a plain dictionary of the record (e.g. for json)"""
+        return dict( (key, getattr( self, key )) for key in self.__slots__ )
+    def __repr__( self ):
+        return '%s( %r, %r, %r, %r, count=%s, bytes=%s )'%(
+            self.__class__.__name__,
+            self.entryPoint, self.sourceType, self.handler, self.site,
+            self.count, self.bytes,
+        )
+
+RECORDS = {}
+_lock = threading.Lock()
+
+def _internal( filename ):
+    return filename.startswith( _PACKAGE ) or filename.startswith( _GENERATED )
+
+def _entryPoint( frame ):
+    """Find the name of the wrapped GL operation frame belongs to (or None)"""
+    operation = getattr( frame.f_locals.get( 'self' ), 'wrappedOperation', None )
+    name = getattr( operation, '__name__', None )
+    if name is None:
+        operation = frame.f_locals.get( 'wrappedOperation' )
+        name = getattr( operation, '__name__', None )
+    return name
+
+def callSite( depth=2 ):
+    """Find (entry point, 'file:line (function)') for the current copy
+
+    depth -- frames to skip (the caller of record() by default)
+    """
+    frame = sys._getframe( depth )
+    entryPoint = None
+    while frame is not None and _internal( frame.f_code.co_filename ):
+        entryPoint = _entryPoint( frame ) or entryPoint
+        frame = frame.f_back
+    if frame is None:
+        return entryPoint, None
+    return entryPoint, '%s:%s (%s)'%(
+        frame.f_code.co_filename, frame.f_lineno, frame.f_code.co_name,
+    )
+
+def record( handler, source, nbytes ):
+    """Record that handler copied/converted source into nbytes of data"""
+    entryPoint, site = callSite( 2 )
+    sourceType = type( source )
+    sourceType = '%s.%s'%( sourceType.__module__, sourceType.__name__ )
+    key = (entryPoint, sourceType, handler, site)
+    with _lock:
+        current = RECORDS.get( key )
+        if current is None:
+            current = RECORDS[key] = CopyRecord( *key )
+        current.count += 1
+        current.bytes += nbytes or 0
+
+def reset( ):
+    """Discard all records"""
+    with _lock:
+        RECORDS.clear()
+
+def statistics( ):
+    """Produce the records sorted (descending) by bytes copied"""
+    with _lock:
+        records = list( RECORDS.values() )
+    return sorted( records, key=lambda record: (-record.bytes, -record.count) )
+
+def report( ):
+    """Produce a text report of the records"""
+    records = statistics()
+    lines = [
+        'PyOpenGL copy diagnostics: %s copies, %s bytes from %s call sites'%(
+            sum( record.count for record in records ),
+            sum( record.bytes for record in records ),
+            len( records ),
+        ),
+        '%8s %12s  %-24s %-20s %-12s %s'%(
+            'copies', 'bytes', 'entry point', 'source type', 'handler', 'call site',
+        ),
+    ]
+    for record in records:
+        lines.append( '%8d %12d  %-24s %-20s %-12s %s'%(
+            record.count,
+            record.bytes,
+            record.entryPoint or '-',
+            record.sourceType,
+            record.handler,
+            record.site or '-',
+        ) )
+    return '\n'.join( lines ) + '\n'
+
+def write( target ):
+    """Write report() to the filename target (or stderr for '-', '1', 'true')"""
+    text = report()
+    if target.lower() in ('-', '1', 'true'):
+        sys.stderr.write( text )
+    else:
+        try:
+            with open( target, 'w' ) as fh:
+                fh.write( text )
+        except (IOError, OSError) as err:
+            _log.warning( 'Unable to write copy diagnostics to %r: %s', target, err )
+
+def install( target ):
+    """Write the report to target at exit, called on import with COPY_DIAGNOSTICS"""
+    atexit.register( write, target )
+
+from OpenGL._configflags import COPY_DIAGNOSTICS
+if COPY_DIAGNOSTICS:
+    install( COPY_DIAGNOSTICS )
@@ -5,6 +5,18 @@ Note:
     to support lists/tuples, as the code here is all available in
     C-level code there.  This implementation is required to allow
     for usage without numpy installed.
+
+    Nested lists are converted by flattening them one level at a
+    time (checking that each level is uniform) and filling a single
+    contiguous buffer (numpy.fromiter for floating-point types when
+    numpy is available, array.array otherwise), which is then viewed
+    as the nested ctypes array type.  Values the fast path cannot
+    convert (out-of-range integers, strings...) fall back to the
+    element-by-element ctypes conversion.
+
+    The converted arrays for (hashable) tuple values are cached per
+    tuple object, so constant tuples passed every frame are only
+    converted once (each call gets its own copy of the array).
 """
 REGISTRY_NAME = 'lists'
 import ctypes, _ctypes
@@ -12,14 +24,23 @@ import ctypes, _ctypes
 from OpenGL.raw.GL import _types 
 from OpenGL.arrays import _arrayconstants as GL_1_1
 from OpenGL import constant, error
-from OpenGL._configflags import ERROR_ON_COPY
-from OpenGL.arrays import formathandler
+from OpenGL._configflags import ERROR_ON_COPY, COPY_DIAGNOSTICS
+from OpenGL.arrays import formathandler, copydiagnostics
 from OpenGL._bytes import bytes,unicode,as_8_bit
 HANDLED_TYPES = (list,tuple)
-import operator
+import array, itertools, operator
+try:
+    import numpy
+except ImportError:
+    numpy = None
+# maximum number of tuple values whose converted arrays are cached
+CACHE_SIZE = 64
 
 def err_on_copy( func ):
-    """Decorator which raises informative error if we try to copy while ERROR_ON_COPY"""
+    """Decorator which raises informative error if we try to copy while ERROR_ON_COPY
+
+    (With COPY_DIAGNOSTICS the copies are recorded by ListHandler.asArray)
+    """
     if not ERROR_ON_COPY:
         return func 
     else:
@@ -71,26 +92,12 @@ class ListHandler( formathandler.FormatHandler ):
     @classmethod
     def dimsOf( cls, x ):
         """Calculate total dimension-set of the elements in x
-        
-        This is *extremely* messy, as it has to track nested arrays
-        where the arrays could be different sizes on all sorts of 
-        levels...
+
+        Raises ValueError if the nested lists are not uniform
         """
-        try:
-            dimensions = [ len(x) ]
-        except (TypeError,AttributeError,ValueError) as err:
+        if not isinstance( x, HANDLED_TYPES ):
             return []
-        else:
-            childDimension = None
-            for child in x:
-                newDimension = cls.dimsOf( child )
-                if childDimension is not None:
-                    if newDimension != childDimension:
-                        raise ValueError( 
-                            """Non-uniform array encountered: %s versus %s"""%(
-                                newDimension, childDimension,
-                            ), x
-                        )
+        return shapeOf( x )[0]
 
     @classmethod
     def arrayToGLType( cls, value ):
@@ -133,17 +140,63 @@ class ListHandler( formathandler.FormatHandler ):
     @classmethod
     def asArray( cls, value, typeCode=None ):
         """Convert given value to a ctypes array value of given typeCode
-        
-        This does a *lot* of work just to get the data into the correct
-        format.  It's not going to be anywhere near as fast as a numpy
-        or similar approach!
+
+        Conversions of (hashable) tuples are cached per tuple object,
+        each call returns a fresh copy of the cached array.
         """
         if typeCode is None:
             raise NotImplementedError( """Haven't implemented type-inference for lists yet""" )
+        if type( value ) is tuple:
+            key = (typeCode, id( value ))
+            cached = _cache.get( key )
+            if cached is not None and cached[0] is value:
+                result = type( cached[1] ).from_buffer_copy( cached[1] )
+                if COPY_DIAGNOSTICS:
+                    copydiagnostics.record( 'lists', value, ctypes.sizeof( result ) )
+                return result
+            result = cls._convert( value, typeCode )
+            if result is not None:
+                try:
+                    hash( value )
+                except TypeError:
+                    # contains mutable values, which may change between calls
+                    return result
+                if len( _cache ) >= CACHE_SIZE:
+                    _cache.pop( next( iter( _cache ) ), None )
+                # holding value keeps id( value ) from being reused
+                _cache[key] = (value, type( result ).from_buffer_copy( result ))
+            return result
+        return cls._convert( value, typeCode )
+    @classmethod
+    def _convert( cls, value, typeCode ):
+        """Convert value to a ctypes array, recording it with COPY_DIAGNOSTICS"""
+        result = cls._convertBuffer( value, typeCode )
+        if COPY_DIAGNOSTICS and result is not None:
+            copydiagnostics.record( 'lists', value, ctypes.sizeof( result ) )
+        return result
+    @classmethod
+    def _convertBuffer( cls, value, typeCode ):
+        """Convert value to a ctypes array using a single contiguous buffer"""
+        arrayType = GL_TYPE_TO_ARRAY_MAPPING[ typeCode ]
+        if not isinstance( value, HANDLED_TYPES ):
+            return arrayType( value )
+        try:
+            dims, items = shapeOf( value )
+            buffer = _fill( arrayType, items )
+        except (TypeError, ValueError, OverflowError):
+            buffer = None
+        if buffer is None or not len( buffer ):
+            return cls._convertItems( value, typeCode )
+        for dim in dims[::-1]:
+            arrayType *= dim
+        return arrayType.from_buffer( buffer )
+    @classmethod
+    def _convertItems( cls, value, typeCode ):
+        """Convert value element-by-element (with ctypes' conversion rules)"""
         arrayType = GL_TYPE_TO_ARRAY_MAPPING[ typeCode ]
         if isinstance( value, (list,tuple)):
             subItems = [
-                cls.asArray( item, typeCode )
+                cls._convertItems( item, typeCode )
                 for item in value
             ]
             if subItems:
@@ -171,6 +224,55 @@ class ListHandler( formathandler.FormatHandler ):
         return ctypes.sizeof( value )
 
 
+_cache = {}
+
+def shapeOf( value ):
+    """Infer the dimensions of nested lists/tuples and flatten them
+
+    Works a level at a time: every item of a level must have the same
+    length, and the items of the next level are collected with
+    itertools.chain, so the per-item work is done in C.
+
+    returns (dims, items) where items is the list of leaf values,
+    raises ValueError for non-uniform nesting
+    """
+    dims = [ len( value ) ]
+    items = value
+    while items and isinstance( items[0], HANDLED_TYPES ):
+        try:
+            lengths = set( map( len, items ) )
+        except TypeError:
+            raise ValueError( """Non-uniform array encountered: sequences mixed with scalars""" )
+        if len( lengths ) != 1:
+            raise ValueError(
+                """Non-uniform array encountered: lengths %s"""%( sorted( lengths ), )
+            )
+        dims.append( lengths.pop() )
+        items = list( itertools.chain.from_iterable( items ) )
+    return dims, items
+
+# leaf types converted the same way by ctypes, array.array and numpy
+_FAST_TYPES = frozenset( (int, float, bool) )
+
+def _fill( arrayType, items ):
+    """Produce a contiguous writable buffer of items as arrayType values
+
+    Returns None (use the element-wise conversion) unless every item is
+    a Python int/float, as numpy.fromiter also converts strings, bytes
+    and None (which ctypes refuses).  numpy.fromiter is used only for
+    floating-point types, as it silently truncates floats stored into
+    integer types, and None is also returned if arrayType has no
+    array.array equivalent.
+    """
+    if not _FAST_TYPES.issuperset( map( type, items ) ):
+        return None
+    code = arrayType._type_
+    if numpy is not None and code in ('f','d'):
+        return numpy.fromiter( items, code, len( items ) )
+    if code in array.typecodes:
+        return array.array( code, items )
+    return None
+
 ARRAY_TO_GL_TYPE_MAPPING = {
     _types.GLdouble: GL_1_1.GL_DOUBLE,
     _types.GLfloat: GL_1_1.GL_FLOAT,
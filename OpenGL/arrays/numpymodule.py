@@ -19,7 +19,7 @@ from OpenGL._bytes import long
 from OpenGL.raw.GL import _types 
 from OpenGL.raw.GL.VERSION import GL_1_1
 from OpenGL import error
-from OpenGL.arrays import formathandler
+from OpenGL.arrays import formathandler, copydiagnostics
 c_void_p = ctypes.c_void_p
 from OpenGL import acceleratesupport
 NumpyHandler = None
@@ -171,9 +171,12 @@ if NumpyHandler is None:
                 contiguous = source.flags.contiguous
             except AttributeError:
                 if typeCode:
-                    return numpy.ascontiguousarray( source, typeCode )
+                    result = numpy.ascontiguousarray( source, typeCode )
                 else:
-                    return numpy.ascontiguousarray( source )
+                    result = numpy.ascontiguousarray( source )
+                if _configflags.COPY_DIAGNOSTICS:
+                    copydiagnostics.record( 'numpy', source, result.nbytes )
+                return result
             else:
                 if contiguous and (typeCode is None or typeCode==source.dtype.char):
                     return source
@@ -197,7 +200,10 @@ if NumpyHandler is None:
                         )
                     if typeCode is None:
                         typeCode = source.dtype.char
-                    return numpy.ascontiguousarray( source, typeCode )
+                    result = numpy.ascontiguousarray( source, typeCode )
+                    if _configflags.COPY_DIAGNOSTICS:
+                        copydiagnostics.record( 'numpy', source, result.nbytes )
+                    return result
         @classmethod
         def unitSize( cls, value, typeCode=None ):
             """Determine unit size of an array (if possible)"""
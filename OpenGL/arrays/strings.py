@@ -2,10 +2,10 @@
 """
 from OpenGL.raw.GL import _types 
 from OpenGL.raw.GL.VERSION import GL_1_1
-from OpenGL.arrays import formathandler
+from OpenGL.arrays import formathandler, copydiagnostics
 import ctypes
 from OpenGL import _bytes, error
-from OpenGL._configflags import ERROR_ON_COPY
+from OpenGL._configflags import ERROR_ON_COPY, COPY_DIAGNOSTICS
 
 def dataPointer( value, typeCode=None ):
     return ctypes.cast(ctypes.c_char_p(value),
@@ -40,9 +40,15 @@ class StringHandler( formathandler.FormatHandler ):
         if isinstance( value, bytes ):
             return value
         elif hasattr( value, 'tostring' ):
-            return value.tostring()
+            result = value.tostring()
         elif hasattr( value, 'raw' ):
-            return value.raw
+            result = value.raw
+        else:
+            result = None
+        if result is not None:
+            if COPY_DIAGNOSTICS:
+                copydiagnostics.record( 'strings', value, len( result ) )
+            return result
         # could convert types to string here, but we're not registered for
         # anything save string types...
         raise TypeError( """String handler got non-string object: %r"""%(type(value)))
@@ -64,11 +70,15 @@ class UnicodeHandler( StringHandler ):
                 raise error.CopyError(
                     """Unicode string passed, cannot copy with ERROR_ON_COPY set, please use 8-bit strings"""
                 )
+            if COPY_DIAGNOSTICS:
+                copydiagnostics.record( 'strings', value, len( converted ) )
             result._temporary_array_ = converted 
         return result
     def asArray( self, value, typeCode=None ):
-        value = _bytes.as_8_bit( value )
-        return StringHandler.asArray( self, value, typeCode=typeCode )
+        converted = _bytes.as_8_bit( value )
+        if COPY_DIAGNOSTICS and converted is not value:
+            copydiagnostics.record( 'strings', value, len( converted ) )
+        return StringHandler.asArray( self, converted, typeCode=typeCode )
 
 
 BYTE_SIZES = {
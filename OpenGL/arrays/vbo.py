@@ -40,7 +40,7 @@ _log = logging.getLogger( 'OpenGL.arrays.vbo' )
 from OpenGL._bytes import long, integer_types
 
 import weakref
-__all__ = ('VBO','VBOHandler','mapVBO')
+__all__ = ('VBO','VBOHandler','mapVBO','StreamingVBO')
 
 class Implementation( object ):
     """Abstraction point for the various implementations that can be used
@@ -82,6 +82,20 @@ class Implementation( object ):
     GL_UNIFORM_BUFFER
     GL_TEXTURE_BUFFER
     GL_TRANSFORM_FEEDBACK_BUFFER'''.split()
+    # used by StreamingVBO, set to None by implementations lacking them
+    OPTIONAL_NAMES = '''glMapBufferRange
+    glBufferStorage
+    glFenceSync
+    glClientWaitSync
+    glDeleteSync
+    GL_MAP_WRITE_BIT
+    GL_MAP_PERSISTENT_BIT
+    GL_MAP_COHERENT_BIT
+    GL_SYNC_GPU_COMMANDS_COMPLETE
+    GL_SYNC_FLUSH_COMMANDS_BIT
+    GL_ALREADY_SIGNALED
+    GL_CONDITION_SATISFIED
+    GL_TIMEOUT_EXPIRED'''.split()
     available = False
     def _arbname( self, name ):
         return (
@@ -463,3 +477,204 @@ def mapVBO( vbo, access=0x88BA ): # GL_READ_WRITE
     array = frombuffer( vp_array, 'B' )
     _cleaners[vbo] = weakref.ref( array, _cleaner( vbo ))
     return array
+
+class StreamingVBO( VBO ):
+    """VBO for (vertex) data which is replaced every frame
+
+    The buffer is a ring of `segments` segments of `size` bytes, each
+    frame's data is written into the next segment while the GL may
+    still be drawing from the previous ones:
+
+        stream = vbo.StreamingVBO( 1024*12 )
+        ...
+        points = stream.map( (count,3), 'f' ) # numpy view of the segment
+        points[:] = ...                        # or stream.write( array )
+        with stream:
+            glVertexPointer( 3, GL_FLOAT, 0, stream )
+            glDrawArrays( GL_POINTS, 0, count )
+
+    Where glBufferStorage (OpenGL 4.4 or ARB_buffer_storage) and sync
+    objects are available the whole buffer is mapped once (persistent,
+    coherent) and map() returns a view of the mapped memory, so writing
+    the data is the only copy.  unbind() inserts a fence after the
+    commands using the segment and map() waits on the fence before the
+    segment is reused, `stalls` counts the waits which had to block.
+
+    Otherwise map() returns a view of a client-side staging array, and
+    bind() orphans the buffer (glBufferData without data, so the driver
+    need not wait for pending draws) and uploads the written bytes with
+    glBufferSubData.
+
+    Passing the stream (or stream + offset) as array data refers to the
+    current segment.  Views returned by map() are only valid until the
+    segment is reused (or the buffer deleted).
+    """
+    TIMEOUT = 1000000000 # nanoseconds per wait on a fence
+    def __init__(
+        self, size, segments=3, usage='GL_STREAM_DRAW',
+        target='GL_ARRAY_BUFFER', persistent=True,
+    ):
+        """Initialize the stream (buffers are created on first use)
+
+        size -- bytes per segment, the most data written per frame
+        segments -- number of segments in the ring
+        usage, target -- as for VBO
+        persistent -- if False, always use orphaning/glBufferSubData
+        """
+        self.segment_size = size
+        self.segments = segments
+        self.persistent = persistent
+        self.segment = -1
+        self.written = 0
+        self.pending = False
+        self.fences = [None] * segments
+        self.mapping = None
+        self.stalls = 0
+        super( StreamingVBO, self ).__init__(
+            None, usage=usage, target=target, size=size*segments,
+        )
+    @property
+    def offset( self ):
+        """Byte offset of the current segment in the buffer"""
+        if self.persistent and self.segment > 0:
+            return self.segment * self.segment_size
+        return 0
+    def create_buffers( self ):
+        """Create and allocate (and if possible persistently map) the buffer"""
+        from numpy import frombuffer, zeros
+        buffers = super( StreamingVBO, self ).create_buffers()
+        implementation = self.implementation
+        self.persistent = bool(
+            self.persistent and
+            implementation.glBufferStorage and
+            implementation.glMapBufferRange and
+            implementation.glFenceSync
+        )
+        implementation.glBindBuffer( self.target, buffers[0] )
+        if self.persistent:
+            flags = (
+                implementation.GL_MAP_WRITE_BIT |
+                implementation.GL_MAP_PERSISTENT_BIT |
+                implementation.GL_MAP_COHERENT_BIT
+            )
+            implementation.glBufferStorage( self.target, self.size, None, flags )
+            pointer = implementation.glMapBufferRange( self.target, 0, self.size, flags )
+            if pointer:
+                self.mapping = frombuffer(
+                    (ctypes.c_ubyte * self.size).from_address( pointer ), 'B',
+                )
+            else:
+                # mapping failed, the storage is immutable so replace the buffer
+                self.persistent = False
+                implementation.glDeleteBuffers( 1, buffers[0] )
+                buffers[0] = long( implementation.glGenBuffers( 1 ) )
+                implementation.glBindBuffer( self.target, buffers[0] )
+        if not self.persistent:
+            # orphaning gives us fresh storage each frame, one segment is enough
+            self.size = self.segment_size
+            implementation.glBufferData( self.target, self.size, None, self.usage )
+            self.mapping = zeros( (self.size,), 'B' )
+        self.copied = True
+        return buffers
+    def map( self, shape=None, dtype='B' ):
+        """Advance to the next segment and return a numpy view for writing to it
+
+        shape -- shape of the returned array, if None the whole segment
+        dtype -- numpy data-type of the returned array
+        """
+        from numpy import dtype as _dtype, prod
+        if not self.buffers:
+            self.create_buffers()
+        self.segment = (self.segment + 1) % self.segments
+        if self.persistent:
+            self.wait( self.segment )
+        itemsize = _dtype( dtype ).itemsize
+        if shape is None:
+            count = self.segment_size // itemsize
+        else:
+            count = int( prod( shape ) )
+            if count * itemsize > self.segment_size:
+                raise ValueError(
+                    """%s bytes requested, segments are %s bytes"""%(
+                        count * itemsize, self.segment_size,
+                    )
+                )
+        start = self.offset
+        view = self.mapping[start:start + count * itemsize].view( dtype )
+        if shape is not None:
+            view = view.reshape( shape )
+        self.data = view
+        self.written = view.nbytes
+        self.pending = True
+        return view
+    def write( self, data ):
+        """Copy array data into the next segment (a single memmove)"""
+        data = ArrayDatatype.asArray( data )
+        size = ArrayDatatype.arrayByteCount( data )
+        view = self.map( (size,) )
+        ctypes.memmove(
+            view.ctypes.data, ArrayDatatype.voidDataPointer( data ), size,
+        )
+        self.data = data
+        return self
+    def set_array( self, data, size=None ):
+        """Only accepted from __init__, use map() or write() to update"""
+        if data is not None:
+            raise TypeError( """Use map() or write() to update a StreamingVBO""" )
+        super( StreamingVBO, self ).set_array( data, size )
+    def copy_data( self ):
+        """Upload the written data (orphaning the buffer) if not persistently mapped"""
+        if self.pending and not self.persistent:
+            self.implementation.glBufferData( self.target, self.size, None, self.usage )
+            if self.written:
+                self.implementation.glBufferSubData(
+                    self.target, 0, self.written, self.mapping,
+                )
+        self.pending = False
+    def unbind( self ):
+        """Fence the current segment and unbind the buffer"""
+        self.fence()
+        super( StreamingVBO, self ).unbind()
+    def fence( self ):
+        """Mark the current segment as in use by the commands issued so far"""
+        if self.persistent and self.segment >= 0:
+            implementation = self.implementation
+            previous = self.fences[self.segment]
+            if previous:
+                implementation.glDeleteSync( previous )
+            self.fences[self.segment] = implementation.glFenceSync(
+                implementation.GL_SYNC_GPU_COMMANDS_COMPLETE, 0,
+            )
+    def wait( self, segment ):
+        """Wait until the GL has finished with the given segment"""
+        fence = self.fences[segment]
+        if not fence:
+            return
+        self.fences[segment] = None
+        implementation = self.implementation
+        result = implementation.glClientWaitSync( fence, 0, 0 )
+        if result == implementation.GL_TIMEOUT_EXPIRED:
+            self.stalls += 1
+            while result == implementation.GL_TIMEOUT_EXPIRED:
+                result = implementation.glClientWaitSync(
+                    fence, implementation.GL_SYNC_FLUSH_COMMANDS_BIT, self.TIMEOUT,
+                )
+        implementation.glDeleteSync( fence )
+    def delete( self ):
+        """Delete this buffer (and its fences) explicitly"""
+        if self.buffers:
+            for fence in self.fences:
+                if fence:
+                    try:
+                        self.implementation.glDeleteSync( fence )
+                    except (AttributeError,error.NullFunctionError) as err:
+                        pass
+        self.fences = [None] * self.segments
+        self.mapping = self.data = None
+        self.segment = -1
+        super( StreamingVBO, self ).delete()
+    def __add__( self, other ):
+        """Create a VBOOffset relative to the current segment"""
+        if hasattr( other, 'offset' ):
+            other = other.offset
+        return VBOOffset( self, self.offset + other )
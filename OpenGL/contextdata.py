@@ -5,127 +5,365 @@ objects we're constructing to shadow Python objects,
 we have to store references to the objects somewhere
 
 For any given Python GUI library, we can use a weakref
-to the library's representation of the GL context to 
-call the cleanup function.  That means some per-GUI 
-library code in OpenGL (or the library), but it gives 
+to the library's representation of the GL context to
+call the cleanup function.  That means some per-GUI
+library code in OpenGL (or the library), but it gives
 us very natural operations within OpenGL.
 
-Note: you can entirely disable use of this module by 
+Each constant used as a key is assigned a small integer
+slot (see slotFor) the first time it is seen, and each
+context's values are held in a single list indexed by
+slot, with weakly-held values stored as weakref.ref
+instances.  Hot callers (e.g. the array-pointer
+storeValues) look up their slot once and then use
+getSlot/setSlot directly.
+
+Contexts are keyed by the integer address of the context
+(see contextKey).  Changes to the set of contexts and the
+growth of a context's list are made under a lock, storing
+and retrieving a slot is a single list operation, so
+contexts can be used from multiple threads.
+
+Context lifecycle hooks:
+
+    contextCreated( context ) -- discards anything stored for
+        a previous context which had the same address
+    invalidateCurrent() -- a context was made current (or
+        released) in this thread
+    contextDestroyed( context ) -- frees everything stored
+        for the context
+
+are called by PyOpenGL's create/make-current/destroy entry
+points (eglCreateContext, eglMakeCurrent, eglDestroyContext,
+their glX, wgl and OSMesa equivalents, and the GLUT window
+functions) when they succeed.  EGL and GLX only destroy a
+context once it is no longer current, so destroying the
+calling thread's current context defers freeing its values
+until the thread next makes a context current (or releases
+it).  Code which manages contexts by other means (e.g. a GUI
+toolkit) should call the hooks itself.  statistics() reports
+the number of values and bytes retained for each context.
+
+With OpenGL.CACHE_CURRENT_CONTEXT set the current context
+is cached per-thread instead of being queried from the
+platform on every access.  The cache is invalidated by
+the make-current hook, and for all threads by
+contextDestroyed.
+
+Note: you can entirely disable use of this module by
 setting:
 
-    OpenGL.ERROR_ON_COPY = True 
-    OpenGL.STORE_POINTERS = False 
-        
+    OpenGL.ERROR_ON_COPY = True
+    OpenGL.STORE_POINTERS = False
+
 before importing OpenGL functionality.
 """
-from OpenGL import platform
-import weakref
-storedPointers = {
-    # map from contextID: { constant: value }
+from OpenGL import platform, _configflags
+from OpenGL._bytes import integer_types
+import ctypes, sys, threading, weakref
+contexts = {
+    # map from contextID: [ value-or-_WeakValue by slot ]
 }
-storedWeakPointers = {
-    # map from contextID: WeakValueDictionary({ constant: value })
+slots = {
+    # map from constant: slot index in the contexts' lists
 }
-STORAGES = [ storedPointers, storedWeakPointers ]
+_lock = threading.RLock()
+_current = threading.local()
+_pending = {
+    # map from contextID: thread ident, destroyed while current in that thread
+}
+# replaced on contextDestroyed to invalidate every thread's cache
+_epoch = object()
+
+class _WeakValue( weakref.ref ):
+    """Marks a weakly-stored value in a context's slot list"""
+    __slots__ = ()
+
+def slotFor( constant ):
+    """Get the (small integer) slot used to store constant"""
+    slot = slots.get( constant )
+    if slot is None:
+        with _lock:
+            slot = slots.setdefault( constant, len( slots ) )
+    return slot
+
+def contextKey( context ):
+    """Get the storage key (integer address) for a context handle
+
+    Platforms and context-creation functions variously return
+    the handle as an integer, a ctypes pointer or a c_void_p (None
+    when there is no context), this gives the same integer for all
+    of them, 0 for no context.
+    """
+    if type( context ) in integer_types:
+        return context
+    if context is None:
+        return 0
+    if isinstance( context, ctypes._Pointer ):
+        return ctypes.cast( context, ctypes.c_void_p ).value or 0
+    if isinstance( context, ctypes._SimpleCData ):
+        return context.value or 0
+    return context
+
+def invalidateCurrent( ):
+    """Forget the cached current context for this thread
+
+    Call whenever a context is made current (or released) by
+    code other than PyOpenGL's make-current entry points.
+    """
+    _current.cached = None
+
+def contextCreated( context ):
+    """Register a newly created context
+
+    Discards values stored for a destroyed context which had the
+    same address (and which was not reported to contextDestroyed).
+    """
+    context = contextKey( context )
+    if context:
+        with _lock:
+            contexts[context] = []
+            _pending.pop( context, None )
+    return context
+
+def contextDestroyed( context ):
+    """Free all values stored for a destroyed context"""
+    global _epoch
+    context = contextKey( context )
+    with _lock:
+        result = contexts.pop( context, None ) is not None
+        _pending.pop( context, None )
+        _epoch = object()
+    return result
+
+def _currentKey( ):
+    """Get the key of this thread's current context (0 if unknown)"""
+    try:
+        return contextKey( platform.GetCurrentContext() )
+    except Exception:
+        return 0
+
+def _releasePending( ):
+    """Free contexts destroyed while current in this thread once no longer current"""
+    if not _pending:
+        return
+    thread = threading.get_ident()
+    with _lock:
+        mine = [ context for context, owner in _pending.items() if owner == thread ]
+    if mine:
+        current = _currentKey()
+        for context in mine:
+            if context != current:
+                contextDestroyed( context )
+
+def _lifecycle( baseOperation, wrapper ):
+    """Produce a lazy wrapper of baseOperation calling wrapper( baseOperation, *args )"""
+    from OpenGL.lazywrapper import lazy
+    wrapper.__name__ = baseOperation.__name__
+    wrapper.__doc__ = getattr( baseOperation, '__doc__', None )
+    return lazy( baseOperation )( wrapper )
+
+def _succeeded( result ):
+    """Did an entry point succeed (void entry points return None)"""
+    return result is None or bool( result )
+
+def makesCurrent( baseOperation ):
+    """Wrap a make-current entry point to call invalidateCurrent()
+
+    The cache is invalidated even if the call fails, and contexts
+    destroyed while current in this thread are freed once released.
+    """
+    def wrapper( baseOperation, *args, **named ):
+        try:
+            return baseOperation( *args, **named )
+        finally:
+            invalidateCurrent()
+            _releasePending()
+    return _lifecycle( baseOperation, wrapper )
+
+def createsContext( baseOperation ):
+    """Wrap a context-creation entry point to call contextCreated( result )"""
+    def wrapper( baseOperation, *args, **named ):
+        result = baseOperation( *args, **named )
+        if result:
+            contextCreated( result )
+        return result
+    return _lifecycle( baseOperation, wrapper )
+
+def destroysContext( baseOperation, index=0, deferCurrent=False ):
+    """Wrap a context-destruction entry point to call contextDestroyed( args[index] )
+
+    The values are only freed if the call succeeds (does not raise
+    and does not return a false value).
+
+    deferCurrent -- if true (EGL, GLX) destroying the calling thread's
+        current context only marks it, its values are freed when the
+        thread next makes a context current (see makesCurrent).
+    """
+    def wrapper( baseOperation, *args, **named ):
+        context = contextKey( args[index] ) if len( args ) > index else 0
+        current = deferCurrent and context and context == _currentKey()
+        result = baseOperation( *args, **named )
+        if context and _succeeded( result ):
+            if current:
+                with _lock:
+                    if context in contexts:
+                        _pending[context] = threading.get_ident()
+            else:
+                contextDestroyed( context )
+        return result
+    return _lifecycle( baseOperation, wrapper )
 
 def getContext( context = None ):
     """Get the context (if passed, just return)
-    
+
     context -- the context ID, if None, the current context
     """
     if context is None:
-        context = platform.GetCurrentContext()
+        cached = getattr( _current, 'cached', None )
+        if cached is not None and cached[0] is _epoch:
+            return cached[1]
+        context = contextKey( platform.GetCurrentContext() )
         if context == 0:
             from OpenGL import error
             raise error.Error(
                 """Attempt to retrieve context when no valid context"""
             )
-    return context
-def setValue( constant, value, context=None, weak=False ):
-    """Set a stored value for the given context
-    
-    constant -- Normally a GL constant value, but can be any hashable value 
-    value -- the value to be stored.  If weak is true must be 
-        weak-reference-able.  If None, then the value will be deleted from 
-        the storage 
-    context -- the context identifier for which we're storing the value
-    weak -- if true, value will be stored with a weakref
-        Note: you should always pass the same value for "weak" for a given 
-        constant, otherwise you will create two storages for the constant.
+        if _configflags.CACHE_CURRENT_CONTEXT:
+            _current.cached = (_epoch, context)
+        return context
+    return contextKey( context )
+
+def _resolve( value ):
+    """Dereference value if it is weakly stored"""
+    if type( value ) is _WeakValue:
+        return value()
+    return value
+
+def setSlot( slot, value, context=None, weak=False ):
+    """Set the stored value for slot (from slotFor) in the given context
+
+    See setValue for the meaning of the arguments
     """
     if getattr( value, '_no_cache_', False ):
-        return 
+        return
     context = getContext( context )
-    if weak:
-        storage = storedWeakPointers
-        cls = weakref.WeakValueDictionary
-    else:
-        storage = storedPointers
-        cls = dict
-    current = storage.get( context )
-    if current is None:
-        storage[context] = current = cls()
-    previous = current.get( constant )
-    if value is None:
-        try:
-            del current[ constant ]
-        except (KeyError,TypeError,ValueError) as err:
-            pass 
-    else:
+    current = contexts.get( context )
+    if current is None or slot >= len( current ):
+        if value is None:
+            return None
+        with _lock:
+            current = contexts.setdefault( context, [] )
+            if slot >= len( current ):
+                current.extend( [None] * (slot + 1 - len( current )) )
+    previous = _resolve( current[slot] )
+    if value is not None and weak:
         # XXX potential for failure here if a non-weakref-able objects
         # is being stored with weak == True
-        current[ constant ] = value 
+        value = _WeakValue( value )
+    current[slot] = value
     return previous
+
+def getSlot( slot, context=None ):
+    """Get the stored value for slot (from slotFor) in the given context"""
+    context = getContext( context )
+    current = contexts.get( context )
+    if current is None or slot >= len( current ):
+        return None
+    return _resolve( current[slot] )
+
+def setValue( constant, value, context=None, weak=False ):
+    """Set a stored value for the given context
+
+    constant -- Normally a GL constant value, but can be any hashable value
+    value -- the value to be stored.  If weak is true must be
+        weak-reference-able.  If None, then the value will be deleted from
+        the storage
+    context -- the context identifier for which we're storing the value
+    weak -- if true, value will be stored with a weakref
+        Note: a constant has a single storage slot, storing a value
+        replaces the previous value whether or not it was weak.
+    """
+    return setSlot( slotFor( constant ), value, context, weak )
+
 def delValue( constant, context=None ):
     """Delete the specified value for the given context
-    
-    constant -- Normally a GL constant value, but can be any hashable value 
+
+    constant -- Normally a GL constant value, but can be any hashable value
     context -- the context identifier for which we're storing the value
     """
     context = getContext( context )
-    found = False
-    for storage in STORAGES:
-        contextStorage = storage.get( context  )
-        if contextStorage:
-            try:
-                del contextStorage[ constant ]
-                found = True
-            except KeyError as err:
-                pass
+    slot = slots.get( constant )
+    current = contexts.get( context )
+    if slot is None or current is None or slot >= len( current ):
+        return False
+    found = current[slot] is not None
+    current[slot] = None
     return found
 
 def getValue( constant, context = None ):
     """Get a stored value for the given constant
-    
+
     constant -- unique ID for the type of data being retrieved
     context -- the context ID, if None, the current context
     """
     context = getContext( context )
-    for storage in STORAGES:
-        contextStorage = storage.get( context  )
-        if contextStorage:
-            value =  contextStorage.get( constant )
-            if value is not None:
-                return value
-    return None
+    slot = slots.get( constant )
+    if slot is None:
+        return None
+    current = contexts.get( context )
+    if current is None or slot >= len( current ):
+        return None
+    return _resolve( current[slot] )
 
 def cleanupContext( context=None ):
     """Cleanup all held pointer objects for the given context
-    
-    Warning: this is dangerous, as if you call it before a context 
+
+    Warning: this is dangerous, as if you call it before a context
     is destroyed you may release memory held by the context and cause
     a protection fault when the GL goes to render the scene!
-    
-    Normally you will want to get the context ID explicitly and then 
-    register cleanupContext as a weakref callback to your GUI library 
+
+    Normally you will want to get the context ID explicitly and then
+    register cleanupContext as a weakref callback to your GUI library
     Context object with the (now invalid) context ID as parameter.
     """
     if context is None:
         context = platform.GetCurrentContext()
-    for storage in STORAGES:
-        try:
-            del storedPointers[ context ]
-        except KeyError as err:
-            return False
-        else:
-            return True
+    return contextDestroyed( context )
+
+def _retainedBytes( value, seen ):
+    """Estimate the memory kept alive by value (not counting ids in seen)"""
+    if value is None or id( value ) in seen:
+        return 0
+    seen.add( id( value ) )
+    if isinstance( value, (list, tuple) ):
+        return sys.getsizeof( value ) + sum( [ _retainedBytes( item, seen ) for item in value ] )
+    if isinstance( value, dict ):
+        return sys.getsizeof( value ) + sum( [
+            _retainedBytes( key, seen ) + _retainedBytes( item, seen )
+            for key, item in value.items()
+        ] )
+    try:
+        # arrays, bytes and ctypes instances
+        return memoryview( value ).nbytes
+    except (TypeError, ValueError):
+        return sys.getsizeof( value )
+
+def statistics( ):
+    """Report retained values and bytes for each context
+
+    returns { contextID: { 'values': count, 'bytes': estimate } }
+    where bytes is the (buffer-protocol or sys.getsizeof)
+    size of the stored values, each object counted once per context.
+    """
+    with _lock:
+        items = [ (context, list( current )) for context, current in contexts.items() ]
+    result = {}
+    for context, current in items:
+        values = [ value for value in map( _resolve, current ) if value is not None ]
+        seen = set()
+        result[context] = {
+            'values': len( values ),
+            'bytes': sum( [ _retainedBytes( value, seen ) for value in values ] ),
+        }
+    return result
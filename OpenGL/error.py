@@ -6,8 +6,14 @@ such as TypeError or ValueError when appropriate.
 ErrorChecker is an _ErrorChecker instance that allows you
 to register a new error-checking function for use 
 throughout the system.
+
+With OpenGL.ERROR_CHECK_INTERVAL set to N, the GL/GLES error
+checkers only call glGetError every N calls and at boundaries
+(glEnd, glFlush, glFinish, buffer swaps and checkpoint()),
+recording the calls made since the last check so that the
+GLError can report the likely culprits.
 """
-import logging
+import collections, logging, weakref
 _log = logging.getLogger( 'OpenGL.error' )
 from OpenGL import platform, _configflags
 from ctypes import ArgumentError
@@ -57,6 +63,9 @@ class GLError( Error ):
         cArguments -- ctypes-level arguments to the operation,
             often raw integers for pointers and the like
         description -- OpenGL description of the error (textual)
+        calls -- for deferred checking, the last (baseOperation, cArguments)
+            made since the previous check (most recent last), normally
+            one of which raised the error
     """
     def __init__( 
         self, 
@@ -67,8 +76,10 @@ class GLError( Error ):
         pyArgs=None, 
         cArgs=None,
         description=None,
+        calls=None,
     ):
         """Initialise the GLError, storing metadata for later display"""
+        self.calls = calls
         (
             self.err, self.result, self.cArguments, 
             self.baseOperation, self.pyArgs, self.cArgs,
@@ -86,6 +97,7 @@ class GLError( Error ):
         'cArgs',
         'cArguments',
         'result', 
+        'calls',
     )
     def __str__( self ):
         """Create a fully formatted representation of the error"""
@@ -152,6 +164,16 @@ class GLError( Error ):
         else:
             return '%s = %r'%( property, value )
 
+    def format_calls( self, property, value ):
+        """Format the deferred-checking call history for display"""
+        return '%s = %s'%(
+            property,
+            self.shortRepr( [
+                '%s%s'%( getattr( operation, '__name__', operation ), self.shortRepr( tuple( arguments or () ) ) )
+                for operation, arguments in value
+            ] ),
+        )
+
 class GLUError( Error ):
     """GLU error implementation class"""
 
@@ -160,10 +182,39 @@ class GLUTError( Error ):
 class EGLError( GLError ):
     """EGL error implementation class"""
 
+# Functions after which deferred error checkers always check
+BOUNDARY_FUNCTIONS = frozenset( ('glEnd', 'glFlush', 'glFinish') )
+_deferredCheckers = weakref.WeakSet()
+
+def checkpoint( ):
+    """Check for errors from calls not yet checked by deferred error checkers
+
+    Raises the GLError for the first checker with a pending error, a
+    no-op unless OpenGL.ERROR_CHECK_INTERVAL is set.
+    """
+    for checker in list( _deferredCheckers ):
+        checker.checkpoint()
+
+def checkpointAfter( baseOperation ):
+    """Wrap a buffer-swap (or similar) entry point to call checkpoint() after it
+
+    Returns baseOperation unchanged unless OpenGL.ERROR_CHECK_INTERVAL is set
+    """
+    if not (_configflags.ERROR_CHECKING and _configflags.ERROR_CHECK_INTERVAL):
+        return baseOperation
+    from OpenGL.lazywrapper import lazy
+    def wrapper( baseOperation, *args, **named ):
+        result = baseOperation( *args, **named )
+        checkpoint()
+        return result
+    wrapper.__name__ = baseOperation.__name__
+    wrapper.__doc__ = getattr( baseOperation, '__doc__', None )
+    return lazy( baseOperation )( wrapper )
+
 if _configflags.ERROR_CHECKING:
     from OpenGL import acceleratesupport
     _ErrorChecker = None
-    if acceleratesupport.ACCELERATE_AVAILABLE:
+    if acceleratesupport.ACCELERATE_AVAILABLE and not _configflags.ERROR_CHECK_INTERVAL:
         try:
             from OpenGL_accelerate.errorchecker import _ErrorChecker
         except ImportError as err:
@@ -176,10 +227,20 @@ if _configflags.ERROR_CHECKING:
                 _registeredChecker -- the checking function enabled when 
                     not doing onBegin/onEnd processing
                 _currentChecker -- currently active checking function
+                _interval -- check every _interval calls (0 for every call)
+                _history -- ring buffer of the calls since the last check
             """
             _getErrors = None
-            def __init__( self, platform, baseOperation=None, noErrorResult=0, errorClass=GLError ):
-                """Initialize from a platform module/reference"""
+            _interval = 0
+            def __init__( 
+                self, platform, baseOperation=None, noErrorResult=0, errorClass=GLError,
+                interval=None,
+            ):
+                """Initialize from a platform module/reference
+
+                interval -- override for OpenGL.ERROR_CHECK_INTERVAL, 0 to
+                    check after every call
+                """
                 self._isValid = platform.CurrentContextIsValid
                 self._getErrors = baseOperation
                 self._noErrorResult = noErrorResult
@@ -192,6 +253,15 @@ if _configflags.ERROR_CHECKING:
                 else:
                     self._registeredChecker = self.nullGetError
                 self._currentChecker = self._registeredChecker
+                if interval is None:
+                    interval = _configflags.ERROR_CHECK_INTERVAL
+                if interval and self._getErrors:
+                    self._interval = interval
+                    self._pending = 0
+                    self._history = collections.deque( maxlen=_configflags.ERROR_HISTORY )
+                    # replaces the per-call check for errcheck users
+                    self.glCheckError = self.deferredCheckError
+                    _deferredCheckers.add( self )
             def __bool__( self ):
                 """We are "true" if we actually do anything"""
                 if self._registeredChecker is self.nullGetError:
@@ -234,6 +304,56 @@ if _configflags.ERROR_CHECKING:
                         baseOperation = baseOperation,
                     )
                 return result
+            def deferredCheckError(
+                self,
+                result,
+                baseOperation=None,
+                cArguments=None,
+                *args
+            ):
+                """Deferred version of glCheckError, checks every _interval calls"""
+                self._history.append( (baseOperation, cArguments) )
+                self._pending += 1
+                if self._pending >= self._interval:
+                    self.checkpoint( result )
+                return result
+            def boundaryCheckError(
+                self,
+                result,
+                baseOperation=None,
+                cArguments=None,
+                *args
+            ):
+                """Deferred-mode check for BOUNDARY_FUNCTIONS, always checks"""
+                self._history.append( (baseOperation, cArguments) )
+                self._pending += 1
+                self.checkpoint( result )
+                return result
+            def checkerFor( self, name ):
+                """Retrieve the errcheck function for the function name"""
+                if self._interval and name in BOUNDARY_FUNCTIONS:
+                    return self.boundaryCheckError
+                return self.glCheckError
+            def checkpoint( self, result=None ):
+                """Check for an error from the calls recorded since the last check"""
+                if not self._interval or not self._pending:
+                    return
+                if self._currentChecker is self.nullGetError:
+                    # inside glBegin/glEnd, wait for glEnd
+                    return
+                err = self._currentChecker()
+                calls = list( self._history )
+                self._history.clear()
+                self._pending = 0
+                if err != self._noErrorResult:
+                    baseOperation, cArguments = calls[-1] if calls else (None, None)
+                    raise self._errorClass(
+                        err,
+                        result,
+                        cArguments = cArguments,
+                        baseOperation = baseOperation,
+                        calls = calls,
+                    )
             def onBegin( self ):
                 """Called by glBegin to record the fact that glGetError won't work"""
                 self._currentChecker = self.nullGetError
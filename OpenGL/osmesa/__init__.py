@@ -1,2 +1,7 @@
 from OpenGL.raw.osmesa._types import *
 from OpenGL.raw.osmesa.mesa import *
+from OpenGL import contextdata as _contextdata
+OSMesaCreateContext = _contextdata.createsContext( OSMesaCreateContext )
+OSMesaCreateContextExt = _contextdata.createsContext( OSMesaCreateContextExt )
+OSMesaMakeCurrent = _contextdata.makesCurrent( OSMesaMakeCurrent )
+OSMesaDestroyContext = _contextdata.destroysContext( OSMesaDestroyContext, 0 )
@@ -112,7 +112,11 @@ class BasePlatform( object ):
             #GLUT spec says error-checking is basically undefined...
             # there *may* be GL errors on GLUT calls that e.g. render 
             # geometry, but that's all basically "maybe" stuff...
-            func.errcheck = error_checker.glCheckError
+            checkerFor = getattr( error_checker, 'checkerFor', None )
+            if checkerFor is not None:
+                func.errcheck = checkerFor( func.__name__ )
+            else:
+                func.errcheck = error_checker.glCheckError
         return func
     def wrapContextCheck( self, func, dll ):
         """Wrap function with context-checking if appropriate"""
@@ -153,28 +157,13 @@ class BasePlatform( object ):
         if (not is_core) and not self.checkExtension( extension ):
             raise AttributeError( """Extension not available""" )
         argTypes = [ self.finalArgType( t ) for t in argTypes ]
-            
-        if force_extension or ((not is_core) and (not self.EXTENSIONS_USE_BASE_FUNCTIONS)):
-            # what about the VERSION values???
-            pointer = self.getExtensionProcedure( as_8_bit(functionName) )
-            if pointer:
-                func = self.functionTypeFor( dll )(
-                    resultType,
-                    *argTypes
-                )(
-                    pointer
-                )
-            else:
-                raise AttributeError( """Extension %r available, but no pointer for function %r"""%(extension,functionName))
-        else:
-            func = ctypesloader.buildFunction(
-                self.functionTypeFor( dll )(
-                    resultType,
-                    *argTypes
-                ),
-                functionName,
-                dll,
-            )
+        func = self.loadFunction(
+            functionName, dll, resultType, argTypes,
+            extension = extension,
+            use_extension_procedure = force_extension or (
+                (not is_core) and (not self.EXTENSIONS_USE_BASE_FUNCTIONS)
+            ),
+        )
         func.__doc__ = doc 
         func.argNames = list(argNames or ())
         func.__name__ = functionName
@@ -194,6 +183,38 @@ class BasePlatform( object ):
                 func.__module__ = module
         return func
 
+    def loadFunction(
+        self,
+        functionName, dll,
+        resultType, argTypes,
+        extension = None,
+        use_extension_procedure = False,
+    ):
+        """Retrieve the bare ctypes function (no error/context checks)
+        
+        raises AttributeError if can't find the procedure...
+        """
+        if use_extension_procedure:
+            # what about the VERSION values???
+            pointer = self.getExtensionProcedure( as_8_bit(functionName) )
+            if pointer:
+                return self.functionTypeFor( dll )(
+                    resultType,
+                    *argTypes
+                )(
+                    pointer
+                )
+            else:
+                raise AttributeError( """Extension %r available, but no pointer for function %r"""%(extension,functionName))
+        return ctypesloader.buildFunction(
+            self.functionTypeFor( dll )(
+                resultType,
+                *argTypes
+            ),
+            functionName,
+            dll,
+        )
+
     def createBaseFunction( 
         self,
         functionName, dll, 
@@ -0,0 +1,326 @@
+"""Null (recording) platform, no GL implementation required
+
+To use the null platform, run your script with:
+
+    PYOPENGL_PLATFORM=null
+
+defined in your shell/execution environment.  Every entry point of
+every library (GL, GLU, GLUT, GLE, GLES, EGL) resolves to an in-process
+stub which records the call and returns a plausible default: glGetError
+reports no error, glGet* fill in a few common values (viewport,
+alignment, version...), glGen* and glCreate* hand out fresh names,
+shaders compile and programs link.  Nothing is drawn.
+
+Calls are recorded, as they arrive at the ctypes level, into a ring
+buffer on the platform's recorder:
+
+    from OpenGL import platform
+    recorder = platform.PLATFORM.recorder
+    recorder.clear()
+    render()
+    for call in recorder.calls():
+        print(call.name, call.args)
+
+Recorded arguments are references, not copies, so arrays which are
+modified after the call will show their later contents.
+recorder.replay() re-issues a recorded command stream against any
+platform (e.g. the real one in another process, given pickled records).
+"""
+import ctypes, itertools, time
+from collections import deque, namedtuple
+from OpenGL.platform import baseplatform
+
+CallRecord = namedtuple( 'CallRecord', ('name','library','args','time') )
+
+class Recorder( object ):
+    """Ring buffer of the calls made through a NullPlatform
+
+    Attributes:
+
+        enabled -- if False, calls are not recorded
+        records -- deque of CallRecord instances (most recent last)
+        signatures -- (library,name) -> (resultType,argTypes) for each
+            function which has been created, used by replay()
+    """
+    DEFAULT_SIZE = 65536
+    def __init__( self, size=DEFAULT_SIZE ):
+        self.enabled = True
+        self.records = deque( maxlen=size )
+        self.signatures = {}
+    def resize( self, size ):
+        """Change the number of calls kept (keeping the most recent)"""
+        self.records = deque( self.records, maxlen=size )
+    def clear( self ):
+        """Forget all recorded calls"""
+        self.records.clear()
+    def calls( self, name=None ):
+        """Retrieve list of recorded calls, optionally only those to name"""
+        if name is None:
+            return list( self.records )
+        return [ record for record in self.records if record.name == name ]
+    def counts( self ):
+        """Retrieve dictionary of name -> number of recorded calls"""
+        result = {}
+        for record in self.records:
+            result[record.name] = result.get( record.name, 0 ) + 1
+        return result
+    def replay( self, records=None, platform=None ):
+        """Re-issue recorded calls (default all recorded) against platform
+
+        platform -- BasePlatform instance, default the current
+            OpenGL.platform.PLATFORM
+
+        Functions are created with createBaseFunction using the
+        signatures seen while recording, so the replayed calls have the
+        same ctypes-level types (and error checking) as the originals.
+
+        returns number of calls replayed
+        """
+        if platform is None:
+            from OpenGL.platform import PLATFORM as platform
+        if records is None:
+            records = list( self.records )
+        functions = {}
+        count = 0
+        for record in records:
+            key = (record.library, record.name)
+            function = functions.get( key )
+            if function is None:
+                resultType, argTypes = self.signatures.get( key, (ctypes.c_int, ()) )
+                function = functions[key] = platform.createBaseFunction(
+                    record.name, getattr( platform, record.library ),
+                    resultType = resultType, argTypes = argTypes,
+                )
+            function( *record.args )
+            count += 1
+        return count
+
+# A few GLenum values, the raw GL modules import the platform, so these
+# can't come from OpenGL.raw.GL ...
+GL_VIEWPORT = 0x0BA2
+GL_SCISSOR_BOX = 0x0C10
+GL_MAX_TEXTURE_SIZE = 0x0D33
+GL_MAX_VIEWPORT_DIMS = 0x0D3A
+GL_UNPACK_ALIGNMENT = 0x0CF5
+GL_PACK_ALIGNMENT = 0x0D05
+GL_MAX_VERTEX_ATTRIBS = 0x8869
+GL_MAX_TEXTURE_IMAGE_UNITS = 0x8872
+GL_MAJOR_VERSION = 0x821B
+GL_MINOR_VERSION = 0x821C
+GL_NUM_EXTENSIONS = 0x821D
+GL_VENDOR = 0x1F00
+GL_RENDERER = 0x1F01
+GL_VERSION = 0x1F02
+GL_EXTENSIONS = 0x1F03
+GL_SHADING_LANGUAGE_VERSION = 0x8B8C
+GL_COMPILE_STATUS = 0x8B81
+GL_LINK_STATUS = 0x8B82
+GL_VALIDATE_STATUS = 0x8B83
+GL_FRAMEBUFFER_COMPLETE = 0x8CD5
+
+def _array_address( value ):
+    """Retrieve the data address for a ctypes-level (output) argument"""
+    value = getattr( value, '_obj', value ) # byref()
+    if isinstance( value, (ctypes._Pointer, ctypes.c_void_p) ):
+        return ctypes.cast( value, ctypes.c_void_p ).value
+    if isinstance( value, ctypes.Array ):
+        return ctypes.addressof( value )
+    if isinstance( value, int ):
+        return value
+    from OpenGL.arrays.arraydatatype import ArrayDatatype
+    return ctypes.cast( ArrayDatatype.voidDataPointer( value ), ctypes.c_void_p ).value
+
+def _write( value, ctype, values ):
+    """Write values into the ctype array at value (if non-NULL)"""
+    address = _array_address( value )
+    if address:
+        (ctype * len(values)).from_address( address )[:] = values
+
+class NullFunction( object ):
+    """Function-pointer-like stub which records calls to the recorder
+
+    Follows the ctypes protocol for errcheck, so the platform's error
+    and context checking apply as for real functions.
+    """
+    errcheck = None
+    def __init__( self, name, library, platform, resultType, argTypes, handler=None ):
+        self.__name__ = name
+        self.library = library
+        self.platform = platform
+        self.restype = resultType
+        self.argtypes = argTypes
+        self.handler = handler
+        platform.recorder.signatures[ (library,name) ] = (resultType, argTypes)
+    def __repr__( self ):
+        return '<NullFunction %s.%s>'%( self.library, self.__name__ )
+    def default( self ):
+        """Result for functions without a handler (per restype)"""
+        restype = self.restype
+        if restype is None:
+            return None
+        if isinstance( restype, type ) and issubclass(
+            restype, (ctypes._Pointer, ctypes.c_void_p, ctypes.c_char_p)
+        ):
+            return None
+        return 0
+    def __call__( self, *args ):
+        recorder = self.platform.recorder
+        if recorder.enabled:
+            recorder.records.append(
+                CallRecord( self.__name__, self.library, args, time.perf_counter() )
+            )
+        if self.handler is not None:
+            result = self.handler( self.platform, args )
+        else:
+            result = self.default()
+        if self.errcheck is not None:
+            return self.errcheck( result, self, args )
+        return result
+
+class NullLibrary( object ):
+    """Stands in for a ctypes library, attributes are NullFunctions"""
+    def __init__( self, name, platform ):
+        self.name = name
+        self.platform = platform
+    def __repr__( self ):
+        return '<NullLibrary %s>'%( self.name, )
+    def __getattr__( self, name ):
+        # FunctionType and the like must not appear to be defined
+        if not name[:1].islower():
+            raise AttributeError( name )
+        function = self.platform.nullFunctionFor(
+            name, self, ctypes.c_int, (),
+        )
+        setattr( self, name, function )
+        return function
+
+def _get_values( ctype ):
+    def handler( platform, args ):
+        values = platform.GET_VALUES.get( args[0] )
+        if values is not None:
+            _write( args[1], ctype, values )
+    return handler
+def _get_status( values ):
+    def handler( platform, args ):
+        _write( args[2], ctypes.c_int, (values.get( args[1], 0 ),) )
+    return handler
+def _gen_names( platform, args ):
+    count = int( args[0] )
+    _write( args[1], ctypes.c_uint, [ next( platform.names ) for i in range(count) ] )
+def _create_name( platform, args ):
+    return next( platform.names )
+def _gen_lists( platform, args ):
+    first = next( platform.names )
+    for i in range( int(args[0]) - 1 ):
+        next( platform.names )
+    return first
+def _get_string( platform, args ):
+    return platform.STRINGS.get( args[0] )
+def _framebuffer_status( platform, args ):
+    return GL_FRAMEBUFFER_COMPLETE
+
+class NullPlatform( baseplatform.BasePlatform ):
+    """Platform on which every entry point is a recording NullFunction
+
+    Attributes of note:
+
+        recorder -- Recorder for the calls made
+        context -- value returned by GetCurrentContext (set to 0 to
+            simulate having no current context)
+        GET_VALUES -- pname -> tuple of values written by glGet*v
+        STRINGS -- name -> bytes returned by glGetString
+    """
+    EXPORTED_NAMES = baseplatform.BasePlatform.EXPORTED_NAMES[:] + [
+        'EGL',
+    ]
+    DEFAULT_FUNCTION_TYPE = staticmethod(ctypes.CFUNCTYPE)
+    EXTENSIONS_USE_BASE_FUNCTIONS = True
+    GET_VALUES = {
+        GL_VIEWPORT: (0, 0, 640, 480),
+        GL_SCISSOR_BOX: (0, 0, 640, 480),
+        GL_MAX_TEXTURE_SIZE: (16384,),
+        GL_MAX_VIEWPORT_DIMS: (16384, 16384),
+        GL_UNPACK_ALIGNMENT: (4,),
+        GL_PACK_ALIGNMENT: (4,),
+        GL_MAX_VERTEX_ATTRIBS: (16,),
+        GL_MAX_TEXTURE_IMAGE_UNITS: (16,),
+        GL_MAJOR_VERSION: (4,),
+        GL_MINOR_VERSION: (5,),
+        GL_NUM_EXTENSIONS: (0,),
+    }
+    STRINGS = {
+        GL_VENDOR: b'PyOpenGL',
+        GL_RENDERER: b'PyOpenGL null platform',
+        GL_VERSION: b'4.5 (null)',
+        GL_EXTENSIONS: b'',
+        GL_SHADING_LANGUAGE_VERSION: b'4.50',
+    }
+    HANDLERS = {
+        'glGetIntegerv': _get_values( ctypes.c_int ),
+        'glGetFloatv': _get_values( ctypes.c_float ),
+        'glGetDoublev': _get_values( ctypes.c_double ),
+        'glGetBooleanv': _get_values( ctypes.c_ubyte ),
+        'glGetInteger64v': _get_values( ctypes.c_int64 ),
+        'glGetString': _get_string,
+        'glGetShaderiv': _get_status( {GL_COMPILE_STATUS:1} ),
+        'glGetProgramiv': _get_status( {GL_LINK_STATUS:1, GL_VALIDATE_STATUS:1} ),
+        'glGenLists': _gen_lists,
+        'glCreateShader': _create_name,
+        'glCreateProgram': _create_name,
+        'glCreateShaderProgramv': _create_name,
+        'glCheckFramebufferStatus': _framebuffer_status,
+        'glCheckNamedFramebufferStatus': _framebuffer_status,
+    }
+    def __init__( self ):
+        self.recorder = Recorder()
+        self.context = 1
+        self.names = itertools.count( 1 )
+        self.fonts = {}
+    @baseplatform.lazy_property
+    def GL( self ): return NullLibrary( 'GL', self )
+    @baseplatform.lazy_property
+    def GLU( self ): return NullLibrary( 'GLU', self )
+    @baseplatform.lazy_property
+    def GLUT( self ): return NullLibrary( 'GLUT', self )
+    @baseplatform.lazy_property
+    def GLE( self ): return NullLibrary( 'GLE', self )
+    @baseplatform.lazy_property
+    def GLES1( self ): return NullLibrary( 'GLES1', self )
+    @baseplatform.lazy_property
+    def GLES2( self ): return NullLibrary( 'GLES2', self )
+    @baseplatform.lazy_property
+    def GLES3( self ): return NullLibrary( 'GLES3', self )
+    @baseplatform.lazy_property
+    def EGL( self ): return NullLibrary( 'EGL', self )
+
+    def nullFunctionFor( self, functionName, dll, resultType, argTypes ):
+        """Create the NullFunction for functionName in dll"""
+        handler = self.HANDLERS.get( functionName )
+        if handler is None and functionName.startswith( 'glGen' ) and not (
+            functionName.startswith( 'glGenerate' )
+        ):
+            handler = _gen_names
+        return NullFunction(
+            functionName, getattr( dll, 'name', 'GL' ), self,
+            resultType, argTypes, handler=handler,
+        )
+    def loadFunction(
+        self,
+        functionName, dll,
+        resultType, argTypes,
+        extension = None,
+        use_extension_procedure = False,
+    ):
+        """Every function is available, as a NullFunction"""
+        return self.nullFunctionFor( functionName, dll, resultType, argTypes )
+    def checkExtension( self, name ):
+        """Every extension is available"""
+        return True
+    def getExtensionProcedure( self, name ):
+        """No real procedures are available (see loadFunction)"""
+        return None
+    def GetCurrentContext( self ):
+        return self.context
+    def getGLUTFontPointer( self, constant ):
+        """Fonts are distinct (fake) pointers, one per font name"""
+        return self.fonts.setdefault( constant, ctypes.c_void_p( len(self.fonts)+1 ) )
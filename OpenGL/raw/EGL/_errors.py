@@ -16,6 +16,8 @@ if _ErrorChecker:
         _p.PLATFORM.EGL.eglGetError, 
         0x3000, # EGL_SUCCESS,
         errorClass = EGLError,
+        # EGL failures are reported by the return value, check immediately
+        interval = 0,
     )
 else:
     _ErrorChecker = None
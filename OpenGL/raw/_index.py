@@ -0,0 +1,374 @@
+"""Pre-built binary index of the constants and functions in OpenGL.raw
+
+Importing a raw module executes every Constant construction and
+@_p.types declaration in it.  The index holds the same information
+(constant values, function signatures, extension membership) for the
+whole raw tree in a single file which is read through mmap, so that a
+constant or function can be materialised on its own, without importing
+anything else from the tree:
+
+    from OpenGL.raw import _index
+    index = _index.load()
+    if index:
+        GL_POINTS = index.constant( 'GL', 'GL_POINTS' )
+        glFlush = index.function( 'GL', 'glFlush' )
+
+The index is generated (by parsing the raw modules, not importing
+them) with:
+
+    python -m OpenGL.raw._index
+
+and is only used if it was built for the running PyOpenGL version.
+
+Values are the defining raw module's own objects if that module has
+already been imported.  Otherwise they are created from the index,
+equal (same name, value and signature) to, but not the same objects as,
+those the raw module creates if it is imported later.  Functions get the
+raw module's name as __module__.
+
+File layout (all little-endian, see the Struct definitions below):
+
+    header
+    module table -- module name, extension name, library, flags
+    entry table -- one per "API:name" key (with the Constant's own
+        name, which can differ for aliases), sorted by key, so that
+        lookups are a binary search over the mapped file
+    member table -- (module, entry) for every definition, sorted by
+        module, for extension membership queries
+    string blob -- utf-8 strings referenced by (offset, length)
+"""
+import ast, ctypes, importlib, logging, mmap, os, struct, sys
+
+_log = logging.getLogger( 'OpenGL.raw._index' )
+
+MAGIC = b'PYOGLIX\x01'
+HEADER = struct.Struct( '<8s9I' )
+MODULE = struct.Struct( '<IHIHIHBx' )
+ENTRY = struct.Struct( '<IHIHHB3xQ' )
+MEMBER = struct.Struct( '<H2xI' )
+
+KIND_INT = 0
+KIND_NEGATIVE = 1
+KIND_FLOAT = 2
+KIND_FUNCTION = 3
+
+FLAG_ERROR_CHECKER = 1
+
+SEPARATOR = '\x1f'
+
+DEFAULT_FILENAME = os.path.join( os.path.dirname( __file__ ), '_index.bin' )
+
+def _module_name( root, path ):
+    relative = os.path.relpath( path, root )[:-3]
+    return '.'.join( ['OpenGL','raw'] + relative.split( os.sep ) )
+
+def _source_files( root ):
+    """Raw module files, VERSION modules first (these win duplicate names)"""
+    files = []
+    for directory, subdirectories, filenames in os.walk( root ):
+        subdirectories.sort()
+        for filename in sorted( filenames ):
+            if filename.endswith( '.py' ) and not filename.startswith( '_' ):
+                files.append( os.path.join( directory, filename ) )
+    return sorted( files, key=lambda path: (os.sep+'VERSION'+os.sep not in path, path) )
+
+def _creator( tree ):
+    """Find (library, has_error_checker) from the module's _f definition"""
+    for node in tree.body:
+        if isinstance( node, ast.FunctionDef ) and node.name == '_f':
+            for statement in node.body:
+                call = getattr( statement, 'value', None )
+                if not isinstance( call, ast.Call ) or len( call.args ) != 3:
+                    continue
+                library = call.args[1]
+                if (
+                    isinstance( library, ast.Attribute ) and
+                    isinstance( library.value, ast.Attribute ) and
+                    library.value.attr == 'PLATFORM'
+                ):
+                    return library.attr, any(
+                        keyword.arg == 'error_checker' for keyword in call.keywords
+                    )
+    return None, False
+
+def _parse( path ):
+    """Parse a raw module, return (extension, library, flags, constants, functions)"""
+    with open( path ) as fh:
+        source = fh.read()
+    if 'Autogenerated by xml_generate' not in source[:200]:
+        return None
+    tree = ast.parse( source, path )
+    extension = None
+    constants = []
+    functions = []
+    library, checked = _creator( tree )
+    for node in tree.body:
+        if isinstance( node, ast.Assign ) and len( node.targets ) == 1:
+            target = node.targets[0]
+            value = node.value
+            if not isinstance( target, ast.Name ):
+                continue
+            if target.id == '_EXTENSION_NAME':
+                extension = ast.literal_eval( value )
+            elif (
+                isinstance( value, ast.Call ) and
+                getattr( value.func, 'id', None ) == '_C' and
+                len( value.args ) == 2
+            ):
+                try:
+                    constants.append( (
+                        target.id,
+                        ast.literal_eval( value.args[0] ),
+                        ast.literal_eval( value.args[1] ),
+                    ) )
+                except ValueError:
+                    pass
+        elif isinstance( node, ast.FunctionDef ) and library:
+            decorators = node.decorator_list
+            names = [ getattr( d, 'id', None ) for d in decorators ]
+            types = [
+                d for d in decorators
+                if isinstance( d, ast.Call ) and ast.unparse( d.func ) == '_p.types'
+            ]
+            if '_f' not in names or len( types ) != 1:
+                continue
+            signature = [ ast.unparse( arg ) for arg in types[0].args ]
+            argNames = [ arg.arg for arg in node.args.args ]
+            functions.append( (
+                node.name,
+                SEPARATOR.join( [signature[0], ','.join( signature[1:] ), ','.join( argNames )] ),
+            ) )
+    flags = FLAG_ERROR_CHECKER if checked else 0
+    return extension, library, flags, constants, functions
+
+class _Strings( object ):
+    """Deduplicated string blob builder"""
+    def __init__( self ):
+        self.blob = bytearray()
+        self.offsets = {}
+    def add( self, value ):
+        value = (value or '').encode( 'utf-8' )
+        offset = self.offsets.get( value )
+        if offset is None:
+            offset = self.offsets[value] = len( self.blob )
+            self.blob.extend( value )
+        return offset, len( value )
+
+def build( filename=DEFAULT_FILENAME, root=None ):
+    """Parse the raw tree and write the index to filename"""
+    from OpenGL.version import __version__
+    if root is None:
+        root = os.path.dirname( __file__ )
+    strings = _Strings()
+    modules = []
+    entries = {}
+    members = []
+    for path in _source_files( root ):
+        parsed = _parse( path )
+        if parsed is None:
+            continue
+        extension, library, flags, constants, functions = parsed
+        module = len( modules )
+        name = _module_name( root, path )
+        api = name.split( '.' )[2]
+        modules.append( MODULE.pack(
+            *( strings.add( name ) + strings.add( extension ) + strings.add( library ) + (flags,) )
+        ) )
+        definitions = []
+        for constant, label, value in constants:
+            if isinstance( value, float ):
+                kind, value = KIND_FLOAT, struct.unpack( '<Q', struct.pack( '<d', value ) )[0]
+            elif isinstance( value, int ) and value < 0:
+                kind, value = KIND_NEGATIVE, -value
+            elif isinstance( value, int ):
+                kind = KIND_INT
+            else:
+                continue
+            definitions.append( (constant, label, kind, value) )
+        for function, signature in functions:
+            offset, length = strings.add( signature )
+            definitions.append( (function, function, KIND_FUNCTION, (offset << 32) | length) )
+        for key, label, kind, value in definitions:
+            key = '%s:%s'%( api, key )
+            if key not in entries:
+                entries[key] = strings.add( label ) + (module, kind, value)
+            members.append( (module, key) )
+    keys = sorted( entries, key=lambda key: key.encode( 'utf-8' ) )
+    positions = dict( (key, i) for i, key in enumerate( keys ) )
+    entryData = b''.join([
+        ENTRY.pack( *( strings.add( key ) + entries[key] ) ) for key in keys
+    ])
+    memberData = b''.join([
+        MEMBER.pack( module, positions[key] ) for module, key in members
+    ])
+    version = strings.add( __version__ )
+    moduleData = b''.join( modules )
+    modulesOffset = HEADER.size
+    entriesOffset = modulesOffset + len( moduleData )
+    membersOffset = entriesOffset + len( entryData )
+    stringsOffset = membersOffset + len( memberData )
+    header = HEADER.pack(
+        MAGIC, version[0], version[1],
+        modulesOffset, len( modules ),
+        entriesOffset, len( keys ),
+        membersOffset, len( members ),
+        stringsOffset,
+    )
+    temporary = '%s.%s.tmp'%( filename, os.getpid() )
+    with open( temporary, 'wb' ) as fh:
+        for data in (header, moduleData, entryData, memberData, bytes( strings.blob )):
+            fh.write( data )
+    os.replace( temporary, filename )
+    return filename
+
+class RawIndex( object ):
+    """mmap-ed view of an index file written by build()"""
+    def __init__( self, filename=DEFAULT_FILENAME ):
+        with open( filename, 'rb' ) as fh:
+            self.data = mmap.mmap( fh.fileno(), 0, access=mmap.ACCESS_READ )
+        (
+            magic, versionOffset, versionLength,
+            self.modulesOffset, self.moduleCount,
+            self.entriesOffset, self.entryCount,
+            self.membersOffset, self.memberCount,
+            self.stringsOffset,
+        ) = HEADER.unpack_from( self.data, 0 )
+        if magic != MAGIC:
+            raise ValueError( """%s is not a raw index file"""%( filename, ) )
+        self.version = self.string( versionOffset, versionLength )
+        self.constants = {}
+        self.functions = {}
+    def string( self, offset, length ):
+        start = self.stringsOffset + offset
+        return self.data[start:start+length].decode( 'utf-8' )
+    def _key( self, position ):
+        offset, length = ENTRY.unpack_from( self.data, self.entriesOffset + position*ENTRY.size )[:2]
+        start = self.stringsOffset + offset
+        return self.data[start:start+length]
+    def find( self, api, name ):
+        """Binary search for api:name, return (label, module, kind, value) or None"""
+        key = ('%s:%s'%( api, name )).encode( 'utf-8' )
+        low, high = 0, self.entryCount
+        while low < high:
+            middle = (low + high)//2
+            if self._key( middle ) < key:
+                low = middle + 1
+            else:
+                high = middle
+        if low < self.entryCount and self._key( low ) == key:
+            labelOffset, labelLength, module, kind, value = ENTRY.unpack_from(
+                self.data, self.entriesOffset + low*ENTRY.size
+            )[2:]
+            return self.string( labelOffset, labelLength ), module, kind, value
+        return None
+    def module( self, module ):
+        """Retrieve (module name, extension, library, flags) for module number"""
+        (
+            nameOffset, nameLength,
+            extensionOffset, extensionLength,
+            libraryOffset, libraryLength,
+            flags,
+        ) = MODULE.unpack_from( self.data, self.modulesOffset + module*MODULE.size )
+        return (
+            self.string( nameOffset, nameLength ),
+            self.string( extensionOffset, extensionLength ),
+            self.string( libraryOffset, libraryLength ),
+            flags,
+        )
+    def moduleFor( self, api, name ):
+        """Retrieve the name of the raw module defining name (or None)"""
+        found = self.find( api, name )
+        if found is None:
+            return None
+        return self.module( found[1] )[0]
+    def constant( self, api, name ):
+        """Materialise the Constant api:name, None if not a known constant"""
+        key = (api, name)
+        current = self.constants.get( key )
+        if current is None:
+            found = self.find( api, name )
+            if found is None or found[2] == KIND_FUNCTION:
+                return None
+            label, module, kind, value = found
+            loaded = sys.modules.get( self.module( module )[0] )
+            if loaded is not None and hasattr( loaded, name ):
+                current = self.constants[key] = getattr( loaded, name )
+                return current
+            if kind == KIND_NEGATIVE:
+                value = -value
+            elif kind == KIND_FLOAT:
+                value = struct.unpack( '<d', struct.pack( '<Q', value ) )[0]
+            from OpenGL.constant import Constant
+            current = self.constants[key] = Constant( label, value )
+        return current
+    def function( self, api, name ):
+        """Materialise the raw (lazily-bound) function api:name, None if unknown"""
+        key = (api, name)
+        current = self.functions.get( key )
+        if current is None:
+            found = self.find( api, name )
+            if found is None or found[2] != KIND_FUNCTION:
+                return None
+            label, module, kind, value = found
+            moduleName, extension, library, flags = self.module( module )
+            loaded = sys.modules.get( moduleName )
+            if loaded is not None and hasattr( loaded, name ):
+                current = self.functions[key] = getattr( loaded, name )
+                return current
+            resultType, argTypes, argNames = self.string( value >> 32, value & 0xffffffff ).split( SEPARATOR )
+            package = 'OpenGL.raw.%s'%( api, )
+            from OpenGL import platform, arrays
+            types = importlib.import_module( package+'._types' )
+            namespace = dict( vars( types ) )
+            namespace.update( _cs=types, ctypes=ctypes, arrays=arrays, _p=platform )
+            if flags & FLAG_ERROR_CHECKER:
+                error_checker = importlib.import_module( package+'._errors' )._error_checker
+            else:
+                error_checker = None
+            current = self.functions[key] = platform.nullFunction(
+                name,
+                getattr( platform.PLATFORM, library ),
+                resultType = eval( resultType, namespace ),
+                argTypes = [ eval( t, namespace ) for t in argTypes.split( ',' ) if t ],
+                doc = None,
+                argNames = [ n for n in argNames.split( ',' ) if n ],
+                extension = extension,
+                module = moduleName,
+                error_checker = error_checker,
+            )
+            type( current ).__module__ = moduleName
+        return current
+    def extensionNames( self, extension ):
+        """Retrieve the names defined by the raw module(s) for extension"""
+        modules = set([
+            i for i in range( self.moduleCount ) if self.module( i )[1] == extension
+        ])
+        result = []
+        for i in range( self.memberCount ):
+            module, position = MEMBER.unpack_from( self.data, self.membersOffset + i*MEMBER.size )
+            if module in modules:
+                result.append( self._key( position ).decode( 'utf-8' ).split( ':', 1 )[1] )
+        return result
+
+_INDEX = None
+def load( filename=DEFAULT_FILENAME ):
+    """Retrieve the RawIndex for filename, None if missing or out of date"""
+    global _INDEX
+    if _INDEX is not None and filename == DEFAULT_FILENAME:
+        return _INDEX or None
+    from OpenGL.version import __version__
+    try:
+        index = RawIndex( filename )
+    except (OSError, ValueError, struct.error) as err:
+        _log.debug( 'No raw index loaded from %s: %s', filename, err )
+        index = False
+    else:
+        if index.version != __version__:
+            _log.info( 'Ignoring raw index for PyOpenGL %s', index.version )
+            index = False
+    if filename == DEFAULT_FILENAME:
+        _INDEX = index
+    return index or None
+
+if __name__ == "__main__":
+    print( build() )
@@ -0,0 +1,218 @@
+#! /usr/bin/env python
+"""Per-call overhead of the PyOpenGL wrapping layers
+
+Runs representative entry points against the null platform (see
+OpenGL.platform.null, no GL implementation or context is needed, call
+recording is disabled) and reports ns/call for each layer a call passes
+through:
+
+    stub -- the bare null-platform function, no errcheck; this is the
+        baseline, the layers above it are PyOpenGL's overhead (ctypes
+        argtypes conversion is not included, the null platform's
+        functions are not ctypes function pointers)
+    errcheck -- plus _ErrorChecker.glCheckError (ERROR_CHECKING)
+    platform -- the function from platform.createBaseFunction, i.e. plus
+        _CheckContext (CONTEXT_CHECKING) and logs._ErrorLoggedFunction
+        (ERROR_LOGGING)
+    wrapper -- the OpenGL.GL entry point, i.e. plus wrapper.Wrapper
+        converters (and STORE_POINTERS for the pointer functions)
+
+The configuration flags are import-time constants, so each combination
+of ERROR_CHECKING, CONTEXT_CHECKING, ERROR_LOGGING and STORE_POINTERS is
+measured in its own subprocess.  PyOpenGL ignores (not STORE_POINTERS)
+unless ERROR_ON_COPY is set, so those runs set it, and the list input
+shows "-" as it raises CopyError there.
+
+    python benchmarks/wrapper_overhead.py
+    python benchmarks/wrapper_overhead.py --entry glVertex2f --json
+"""
+import argparse, itertools, json, logging, os, subprocess, sys, timeit
+
+# run against this checkout of PyOpenGL
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+FLAGS = ("ERROR_CHECKING", "CONTEXT_CHECKING", "ERROR_LOGGING", "STORE_POINTERS")
+LAYERS = ("stub", "errcheck", "platform", "wrapper")
+
+# name -> (entry point, setup for the wrapper call, wrapper call, raw call)
+ENTRIES = {
+    "glVertex2f": (
+        "glVertex2f", "", "f(1.0, 2.0)", "f(1.0, 2.0)",
+    ),
+    "glColor3f": (
+        "glColor3f", "", "f(1.0, 0.5, 0.0)", "f(1.0, 0.5, 0.0)",
+    ),
+    "glVertexPointer(numpy)": (
+        "glVertexPointer",
+        "data = numpy.zeros((64, 2), 'f')",
+        "f(2, GL_FLOAT, 0, data)",
+        "f(2, GL_FLOAT, 0, data)",
+    ),
+    "glVertexPointer(list)": (
+        "glVertexPointer",
+        "data = [[float(i), float(i)] for i in range(64)]; "
+        "raw = numpy.array(data, 'f')",
+        "f(2, GL_FLOAT, 0, data)",
+        "f(2, GL_FLOAT, 0, raw)",
+    ),
+    "glVertexPointer(bytes)": (
+        "glVertexPointer",
+        "data = bytes(64 * 2 * 4)",
+        "f(2, GL_FLOAT, 0, data)",
+        "f(2, GL_FLOAT, 0, data)",
+    ),
+    "glGetIntegerv": (
+        "glGetIntegerv",
+        "out = numpy.zeros((4,), 'i')",
+        "f(GL_VIEWPORT)",
+        "f(GL_VIEWPORT, out)",
+    ),
+    "glReadPixels": (
+        "glReadPixels",
+        "out = numpy.zeros((16, 16, 4), 'B')",
+        "f(0, 0, 16, 16, GL_RGBA, GL_UNSIGNED_BYTE)",
+        "f(0, 0, 16, 16, GL_RGBA, GL_UNSIGNED_BYTE, out)",
+    ),
+}
+
+
+def _layers(function):
+    """Resolve the callables for each layer below the platform function"""
+    base = function
+    if hasattr(type(base), "load") and not getattr(base, "resolved", True):
+        base.load()
+    if hasattr(type(base), "load"):
+        base = type(base).__call__.__self__
+    platform_function = base
+    from OpenGL import logs
+    from OpenGL.platform import baseplatform, null
+
+    while True:
+        if isinstance(base, logs._LoggedFunction):
+            base = getattr(base, "")
+        elif isinstance(base, baseplatform._CheckContext):
+            base = base.func
+        else:
+            break
+    bare = null.NullFunction(
+        base.__name__, base.library, base.platform,
+        base.restype, base.argtypes, handler=base.handler,
+    )
+    return {
+        "stub": bare,
+        "errcheck": base if base.errcheck is not None else None,
+        "platform": platform_function,
+    }
+
+
+def run_child(names, number, repeat):
+    """Measure the current flag combination, print one JSON row per entry"""
+    # failures are expected (e.g. lists under ERROR_ON_COPY), don't log them
+    logging.getLogger("OpenGL").setLevel(logging.CRITICAL)
+    import numpy
+    from OpenGL import GL, _configflags, platform
+    platform.PLATFORM.recorder.enabled = False
+    from OpenGL.raw.GL.VERSION import GL_1_0, GL_1_1
+
+    flags = dict((flag, bool(getattr(_configflags, flag))) for flag in FLAGS)
+    for name in names:
+        entry, setup, call, rawCall = ENTRIES[name]
+        namespace = {"numpy": numpy}
+        namespace.update(
+            (key, value) for key, value in vars(GL).items() if key.startswith("GL_")
+        )
+        exec(setup, namespace)
+        raw = getattr(GL_1_0, entry, None) or getattr(GL_1_1, entry)
+        callables = _layers(raw)
+        callables["wrapper"] = getattr(GL, entry)
+        row = {"entry": name, "flags": flags}
+        for layer in LAYERS:
+            function = callables.get(layer)
+            if function is None:
+                row[layer] = None
+                continue
+            namespace["f"] = function
+            stmt = call if layer == "wrapper" else rawCall
+            try:
+                eval(stmt, namespace)
+                best = min(
+                    timeit.repeat(stmt, globals=namespace, number=number, repeat=repeat)
+                )
+            except Exception as err:
+                row[layer] = None
+                row.setdefault("errors", {})[layer] = repr(err)
+                continue
+            row[layer] = best / number * 1e9
+        print(json.dumps(row))
+        sys.stdout.flush()
+
+
+def combinations():
+    """All settings of FLAGS, as lists of (flag, value)"""
+    for values in itertools.product((False, True), repeat=len(FLAGS)):
+        yield list(zip(FLAGS, values))
+
+
+def run_combination(settings, names, number, repeat):
+    """Run a child process for one flag combination, return its rows"""
+    environ = dict(os.environ)
+    environ["PYOPENGL_PLATFORM"] = "null"
+    environ["PYTHONPATH"] = os.pathsep.join(
+        [ROOT] + [path for path in [environ.get("PYTHONPATH")] if path]
+    )
+    for flag, value in settings:
+        environ["PYOPENGL_%s" % (flag,)] = "true" if value else "false"
+    if not dict(settings)["STORE_POINTERS"]:
+        # not STORE_POINTERS is ignored unless ERROR_ON_COPY is set
+        environ["PYOPENGL_ERROR_ON_COPY"] = "true"
+    command = [
+        sys.executable, os.path.abspath(__file__), "--child",
+        "--number", str(number), "--repeat", str(repeat),
+    ]
+    for name in names:
+        command.extend(["--entry", name])
+    output = subprocess.check_output(command, env=environ)
+    return [json.loads(line) for line in output.decode("utf-8").splitlines() if line]
+
+
+def format_rows(rows):
+    """Produce a text table of the rows"""
+    header = ["EC", "CC", "EL", "SP", "entry"] + list(LAYERS)
+    lines = ["%-2s %-2s %-2s %-2s %-24s" % tuple(header[:5]) + "".join("%10s" % l for l in LAYERS)]
+    for row in rows:
+        flags = ["x" if row["flags"][flag] else "-" for flag in FLAGS]
+        cells = ["%10.0f" % row[l] if row[l] is not None else "%10s" % "-" for l in LAYERS]
+        lines.append("%-2s %-2s %-2s %-2s %-24s" % tuple(flags + [row["entry"]]) + "".join(cells))
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--entry", action="append", choices=sorted(ENTRIES),
+        help="entry point to measure (repeatable, default all)",
+    )
+    parser.add_argument("--number", type=int, default=20000, help="calls per timing")
+    parser.add_argument("--repeat", type=int, default=5, help="timings per layer (best is kept)")
+    parser.add_argument("--json", action="store_true", help="print JSON rows instead of a table")
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    options = parser.parse_args()
+    names = options.entry or list(ENTRIES)
+    if options.child:
+        run_child(names, options.number, options.repeat)
+        return
+    rows = []
+    for settings in combinations():
+        rows.extend(run_combination(settings, names, options.number, options.repeat))
+    if options.json:
+        for row in rows:
+            print(json.dumps(row))
+    else:
+        print("ns/call; EC=ERROR_CHECKING CC=CONTEXT_CHECKING EL=ERROR_LOGGING SP=STORE_POINTERS")
+        print(format_rows(rows))
+
+
+if __name__ == "__main__":
+    main()
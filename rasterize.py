@@ -0,0 +1,109 @@
+"""Bulk midpoint rasterization for the lab scripts
+
+The functions here produce the same pixels as the classic midpoint
+line and circle loops, but compute a whole primitive at once with
+NumPy and return it as an (N, 2) integer array of x, y points.
+The shape of a primitive depends only on its deltas/radius, so the
+offsets are cached and translated to the requested position.
+
+    points = line_points(10, 10, 200, 80)
+    draw_points(points)
+"""
+from functools import lru_cache
+
+import numpy
+from OpenGL.GL import (
+    GL_FLOAT,
+    GL_POINTS,
+    GL_VERTEX_ARRAY,
+    glDisableClientState,
+    glDrawArrays,
+    glEnableClientState,
+    glVertexPointer,
+)
+
+
+def _frozen(array):
+    array.setflags(write=False)
+    return array
+
+
+@lru_cache(maxsize=4096)
+def line_offsets(dx, dy):
+    """Midpoint (Bresenham) line from (0, 0) to (dx, dy)
+
+    Matches the step-by-step loop with err = |dx| - |dy|, including its
+    tie-breaking: the minor axis advances once the accumulated error
+    passes half a pixel.
+    """
+    adx, ady = abs(dx), abs(dy)
+    sx = 1 if dx > 0 else -1
+    sy = 1 if dy > 0 else -1
+    steps = numpy.arange(max(adx, ady) + 1)
+    points = numpy.empty((len(steps), 2), dtype=numpy.int32)
+    if adx >= ady:
+        points[:, 0] = steps * sx
+        points[:, 1] = (2 * steps * ady + adx - 1) // (2 * adx) * sy if adx else 0
+    else:
+        points[:, 0] = (2 * steps * adx + ady - 1) // (2 * ady) * sx
+        points[:, 1] = steps * sy
+    return _frozen(points)
+
+
+@lru_cache(maxsize=256)
+def circle_offsets(radius):
+    """Midpoint circle outline around (0, 0), all eight octants
+
+    Points are repeated where octants meet, as in the loop version.
+    """
+    if radius == 0:
+        return _frozen(numpy.zeros((8, 2), dtype=numpy.int32))
+    x = numpy.arange(radius + 1, dtype=numpy.int64)
+    # first octant: largest y with x^2 + y^2 - y < r^2 (decision d = 1 - r)
+    limit = radius * radius - x * x
+    y = numpy.floor((1 + numpy.sqrt(numpy.maximum(4 * limit - 3, 0))) / 2).astype(numpy.int64)
+    y -= x * x + y * y - y >= radius * radius
+    y += x * x + (y + 1) * y < radius * radius
+    keep = x <= y
+    x, y = x[keep], y[keep]
+    octants = [
+        (x, y), (y, x), (-x, y), (-y, x),
+        (x, -y), (y, -x), (-x, -y), (-y, -x),
+    ]
+    points = numpy.empty((8 * len(x), 2), dtype=numpy.int32)
+    for i, (px, py) in enumerate(octants):
+        points[i::8, 0] = px
+        points[i::8, 1] = py
+    return _frozen(points)
+
+
+@lru_cache(maxsize=256)
+def filled_circle_offsets(radius):
+    """Every pixel with dx*dx + dy*dy <= r*r, rows from bottom to top"""
+    dy, dx = numpy.mgrid[-radius:radius + 1, -radius:radius + 1]
+    inside = dx * dx + dy * dy <= radius * radius
+    return _frozen(numpy.column_stack((dx[inside], dy[inside])).astype(numpy.int32))
+
+
+def line_points(x1, y1, x2, y2):
+    """Pixels of the midpoint line from (x1, y1) to (x2, y2)"""
+    return line_offsets(x2 - x1, y2 - y1) + (x1, y1)
+
+
+def circle_points(cx, cy, radius):
+    """Pixels of the midpoint circle outline centred on (cx, cy)"""
+    return circle_offsets(radius) + (cx, cy)
+
+
+def filled_circle_points(cx, cy, radius):
+    """Pixels of the filled circle centred on (cx, cy)"""
+    return filled_circle_offsets(radius) + (cx, cy)
+
+
+def draw_points(points):
+    """Draw an (N, 2) point array with a single glDrawArrays call"""
+    points = numpy.ascontiguousarray(points, dtype=numpy.float32)
+    glEnableClientState(GL_VERTEX_ARRAY)
+    glVertexPointer(2, GL_FLOAT, 0, points)
+    glDrawArrays(GL_POINTS, 0, len(points))
+    glDisableClientState(GL_VERTEX_ARRAY)